@@ -1,24 +1,178 @@
 """AI client for interacting with Claude API for code refactoring."""
 
+import asyncio
+import atexit
+import hashlib
 import os
-from typing import Dict, Optional
-from anthropic import Anthropic
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    DEFAULT_CONNECTION_LIMITS,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+)
+
+
+# Built with the SDK's own Limits class, as it may use a different HTTP
+# package than a plain httpx import would give
+_HTTP_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=60
+)
+
+# Shared connection pool so TCP/TLS handshakes are reused across AIClient
+# instances and refactor calls within a process.
+_SHARED_HTTP = DefaultHttpxClient(limits=_HTTP_LIMITS)
+atexit.register(_SHARED_HTTP.close)
+
+
+# Token counts by SHA-256 of model and prompt, shared by every AIClient in
+# the process
+_TOKEN_COUNTS = OrderedDict()
+_TOKEN_COUNTS_LOCK = threading.Lock()
+
+
+# Static instructions sent as the system prompt, marked for prompt caching.
+# At ~130 tokens this is below the 1024-token minimum the Sonnet models
+# cache, so today the marker is a no-op and cache_read stays 0; it takes
+# effect only if the instructions grow past that size. Keep this
+# byte-stable, as any change would then invalidate the cache.
+SYSTEM_INSTRUCTIONS = """You are an expert code refactoring assistant. Your task is to refactor the provided code according to the specified requirements.
+
+Please refactor the code according to the goal. Follow these guidelines:
+1. Preserve all functionality while improving code quality
+2. Apply modern best practices and patterns
+3. Improve readability and maintainability
+4. Add appropriate comments where helpful
+5. Ensure the refactored code is production-ready
+
+Provide ONLY the refactored code in your response, without explanations or markdown code blocks unless they are part of the code itself."""
+
+# Fixed fragments of the per-request user prompt, joined around the variable
+# parts in _build_refactor_prompt.
+_PROMPT_HEAD = "Source File: "
+_PROMPT_MID1 = "\nRefactoring Goal: "
+_PROMPT_MID2 = "\n\nOriginal Code:\n```\n"
+_PROMPT_TAIL = "\n```"
+
+# Classifies API errors in one regex call. Each alternative is an anchored
+# lookahead, so the first listed category wins no matter where its marker
+# appears in the message (rate limit before quota before auth, and so on).
+_API_ERROR_RE = re.compile(
+    r"^(?:"
+    r"(?=.*?(?:rate_limit_error|429))(?P<rate_limit>)"
+    r"|(?=.*?(?:insufficient_quota|(?i:quota)))(?P<quota>)"
+    r"|(?=.*?(?:invalid_api_key|authentication_error|401))(?P<auth>)"
+    r"|(?=.*?(?:overloaded_error|529))(?P<overloaded>)"
+    r"|(?=.*?(?i:timeout|timed out))(?P<timeout>)"
+    r"|(?=.*?(?i:network|connection))(?P<network>)"
+    r")",
+    re.DOTALL
+)
+
+_API_ERROR_MESSAGES = {
+    'rate_limit': (
+        "Rate limit exceeded. You're making requests too quickly. "
+        "Please wait a moment and try again."
+    ),
+    'quota': (
+        "API quota exceeded. Your account has run out of credits. "
+        "Please check your usage at https://console.anthropic.com/ "
+        "and add more credits to continue."
+    ),
+    'auth': (
+        "Invalid API key. Please check your API key is correct. "
+        "Run 'ai-governance init' to reconfigure."
+    ),
+    'overloaded': (
+        "Anthropic's API is temporarily overloaded. "
+        "Please wait a few moments and try again."
+    ),
+    'timeout': (
+        "Request timed out. The API took too long to respond. "
+        "Please try again with a smaller file or simpler refactoring goal."
+    ),
+    'network': (
+        "Network error. Please check your internet connection and try again."
+    ),
+}
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that spaces requests to a per-minute rate."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it.
+
+        Tokens may go negative: each caller reserves its own slot, so
+        concurrent callers are queued instead of racing for the next token.
+
+        Returns:
+            Seconds to sleep before sending the request (0 if none)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated) * self.refill_per_second
+            )
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_per_second
 
 
 class AIClient:
     """Client for AI-powered code refactoring using Claude."""
 
+    # Number of token counts remembered by _count_tokens
+    TOKEN_CACHE_SIZE = 256
+
+    # Seconds allowed for the token counting call. It only feeds an
+    # estimate, so it is not retried and gives up quickly when offline.
+    TOKEN_COUNT_TIMEOUT = 5.0
+
     # Pricing for Claude Sonnet 4 (as of 2025)
     # These are approximate values - adjust based on actual pricing
     INPUT_PRICE_PER_1M = 3.0  # USD per 1M input tokens
     OUTPUT_PRICE_PER_1M = 15.0  # USD per 1M output tokens
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-5-20250929"):
+    # Prompt cache pricing relative to the base input price
+    CACHE_READ_MULTIPLIER = 0.1
+    CACHE_WRITE_MULTIPLIER = 1.25
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-sonnet-4-5-20250929",
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 5
+    ):
         """Initialize AI client.
 
         Args:
             api_key: Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY env var
             model: Model to use for refactoring
+            requests_per_minute: Optional client-side cap on refactoring
+                requests, shared by sync and async calls on this client
+            max_retries: Retries for 429/529/5xx and connection errors. The
+                SDK backs off exponentially with jitter and honors the
+                retry-after header.
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -27,20 +181,44 @@ class AIClient:
             )
 
         self.model = model
-        self.client = Anthropic(api_key=self.api_key)
+        self.max_retries = max_retries
+        self.client = Anthropic(
+            api_key=self.api_key,
+            http_client=_SHARED_HTTP,
+            max_retries=max_retries
+        )
+        self._limiter = _TokenBucket(requests_per_minute) if requests_per_minute else None
+
+    def _async_client(self) -> AsyncAnthropic:
+        """Create an async Anthropic client with its own connection pool.
+
+        Async connections are bound to the event loop that opened them, so
+        callers open the client with ``async with`` inside the running loop
+        and it is closed before that loop ends.
+        """
+        return AsyncAnthropic(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
+            max_retries=self.max_retries
+        )
 
     def refactor_code(
         self,
         code: str,
         target_description: str,
-        filepath: str
+        filepath: str,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> Dict:
         """Refactor code using Claude API.
 
+        The response is streamed so output arrives as it is generated
+        rather than after the whole completion has finished.
+
         Args:
             code: Source code to refactor
             target_description: Description of desired refactoring
             filepath: Path to source file (for context)
+            on_chunk: Optional callback invoked with each streamed text chunk
 
         Returns:
             Dictionary with:
@@ -49,56 +227,220 @@ class AIClient:
             - error: str (if failed)
             - tokens_used: dict with input and output tokens
             - cost: float (estimated cost in USD)
+            - rate_limits: dict of anthropic-ratelimit-* response headers
+        """
+        try:
+            if self._limiter is not None:
+                delay = self._limiter.reserve()
+                if delay:
+                    time.sleep(delay)
+
+            # Stream from Claude API
+            with self.client.messages.stream(
+                **self._build_request_params(code, target_description, filepath)
+            ) as stream:
+                for text in stream.text_stream:
+                    if on_chunk is not None:
+                        on_chunk(text)
+                message = stream.get_final_message()
+                headers = stream.response.headers
+
+            return self._build_result(message, headers=headers)
+
+        except Exception as e:
+            return self._build_error_result(e)
+
+    async def refactor_code_async(
+        self,
+        code: str,
+        target_description: str,
+        filepath: str
+    ) -> Dict:
+        """Refactor code using the async Claude API.
+
+        Args:
+            code: Source code to refactor
+            target_description: Description of desired refactoring
+            filepath: Path to source file (for context)
+
+        Returns:
+            Result dictionary as described in refactor_code()
+        """
+        async with self._async_client() as aclient:
+            return await self._refactor_with(aclient, code, target_description, filepath)
+
+    async def _refactor_with(
+        self,
+        aclient: AsyncAnthropic,
+        code: str,
+        target_description: str,
+        filepath: str
+    ) -> Dict:
+        """Refactor code with an open async client.
+
+        Args:
+            aclient: Async client opened in the running event loop
+            code: Source code to refactor
+            target_description: Description of desired refactoring
+            filepath: Path to source file (for context)
+
+        Returns:
+            Result dictionary as described in refactor_code()
         """
         try:
-            # Build prompt
-            prompt = self._build_refactor_prompt(code, target_description, filepath)
-
-            # Call Claude API
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            if self._limiter is not None:
+                delay = self._limiter.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+
+            response = await aclient.messages.with_raw_response.create(
+                **self._build_request_params(code, target_description, filepath)
             )
 
-            # Extract refactored code
-            refactored_code = message.content[0].text
-
-            # Calculate tokens and cost
-            input_tokens = message.usage.input_tokens
-            output_tokens = message.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
-
-            cost = self._calculate_cost(input_tokens, output_tokens)
-
-            return {
-                'success': True,
-                'refactored_code': refactored_code,
-                'tokens_used': {
-                    'input': input_tokens,
-                    'output': output_tokens,
-                    'total': total_tokens
-                },
-                'cost': cost,
-                'model': self.model
-            }
+            return self._build_result(await response.parse(), headers=response.headers)
 
         except Exception as e:
-            # Parse error for user-friendly messages
-            error_message = self._parse_api_error(e)
-
-            return {
-                'success': False,
-                'error': error_message,
-                'tokens_used': {'input': 0, 'output': 0, 'total': 0},
-                'cost': 0.0,
-                'model': self.model
+            return self._build_error_result(e)
+
+    async def refactor_many(self, jobs: List[Dict], concurrency: int = 8) -> List[Dict]:
+        """Refactor several files concurrently.
+
+        All requests share one async client, closed before this returns, so
+        each asyncio.run() gets a fresh connection pool. The CLI does not use
+        this: bulk-refactor already overlaps requests by running
+        refactor_code() on BatchProcessor's worker threads, and it reports
+        and applies each file as soon as its response arrives, whereas this
+        returns only once every job has finished.
+
+        Args:
+            jobs: List of dicts with code, target_description and filepath keys
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of result dictionaries in the same order as jobs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with self._async_client() as aclient:
+            async def guard(job: Dict) -> Dict:
+                async with semaphore:
+                    return await self._refactor_with(
+                        aclient,
+                        code=job['code'],
+                        target_description=job['target_description'],
+                        filepath=job['filepath']
+                    )
+
+            return await asyncio.gather(*(guard(job) for job in jobs))
+
+    def _build_request_params(
+        self,
+        code: str,
+        target_description: str,
+        filepath: str
+    ) -> Dict:
+        """Build the Messages API parameters for a refactoring request.
+
+        Args:
+            code: Source code to refactor
+            target_description: Description of desired refactoring
+            filepath: Path to source file (for context)
+
+        Returns:
+            Keyword arguments for messages.create()
+        """
+        prompt = self._build_refactor_prompt(code, target_description, filepath)
+
+        return {
+            'model': self.model,
+            'max_tokens': 8192,
+            'system': [
+                {
+                    "type": "text",
+                    "text": SYSTEM_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            'messages': [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _build_result(self, message, headers=None) -> Dict:
+        """Convert an API message into a refactoring result dictionary.
+
+        Args:
+            message: Message returned by the API
+            headers: HTTP response headers, if available
+
+        Returns:
+            Result dictionary as described in refactor_code()
+        """
+        # Extract refactored code
+        refactored_code = message.content[0].text
+
+        # Calculate tokens and cost
+        usage = message.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_read_tokens = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write_tokens = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        total_tokens = input_tokens + cache_read_tokens + cache_write_tokens + output_tokens
+
+        cost = self._calculate_cost(
+            input_tokens,
+            output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens
+        )
+
+        return {
+            'success': True,
+            'refactored_code': refactored_code,
+            'tokens_used': {
+                'input': input_tokens,
+                'output': output_tokens,
+                'cache_read': cache_read_tokens,
+                'cache_write': cache_write_tokens,
+                'total': total_tokens
+            },
+            'cost': cost,
+            'model': self.model,
+            'rate_limits': {
+                name: value
+                for name, value in (headers or {}).items()
+                if name.lower().startswith('anthropic-ratelimit-')
             }
+        }
+
+    def _build_error_result(self, error: Exception) -> Dict:
+        """Build a failed refactoring result dictionary.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            Result dictionary as described in refactor_code()
+        """
+        # Parse error for user-friendly messages
+        error_message = self._parse_api_error(error)
+
+        return {
+            'success': False,
+            'error': error_message,
+            'tokens_used': {
+                'input': 0,
+                'output': 0,
+                'cache_read': 0,
+                'cache_write': 0,
+                'total': 0
+            },
+            'cost': 0.0,
+            'model': self.model
+        }
 
     def _parse_api_error(self, error: Exception) -> str:
         """Parse API errors into user-friendly messages.
@@ -111,42 +453,9 @@ class AIClient:
         """
         error_str = str(error)
 
-        # Check for specific error types
-        if 'rate_limit_error' in error_str or '429' in error_str:
-            return (
-                "Rate limit exceeded. You're making requests too quickly. "
-                "Please wait a moment and try again."
-            )
-
-        elif 'insufficient_quota' in error_str or 'quota' in error_str.lower():
-            return (
-                "API quota exceeded. Your account has run out of credits. "
-                "Please check your usage at https://console.anthropic.com/ "
-                "and add more credits to continue."
-            )
-
-        elif 'invalid_api_key' in error_str or 'authentication_error' in error_str or '401' in error_str:
-            return (
-                "Invalid API key. Please check your API key is correct. "
-                "Run 'ai-governance init' to reconfigure."
-            )
-
-        elif 'overloaded_error' in error_str or '529' in error_str:
-            return (
-                "Anthropic's API is temporarily overloaded. "
-                "Please wait a few moments and try again."
-            )
-
-        elif 'timeout' in error_str.lower() or 'timed out' in error_str.lower():
-            return (
-                "Request timed out. The API took too long to respond. "
-                "Please try again with a smaller file or simpler refactoring goal."
-            )
-
-        elif 'network' in error_str.lower() or 'connection' in error_str.lower():
-            return (
-                "Network error. Please check your internet connection and try again."
-            )
+        match = _API_ERROR_RE.match(error_str)
+        if match:
+            return _API_ERROR_MESSAGES[match.lastgroup]
 
         # Generic error - show original message
         return f"API error: {error_str}"
@@ -157,7 +466,10 @@ class AIClient:
         target_description: str,
         filepath: str
     ) -> str:
-        """Build the refactoring prompt for Claude.
+        """Build the per-request part of the refactoring prompt.
+
+        The static instructions live in SYSTEM_INSTRUCTIONS, which is too
+        short to be cached today (see the note there).
 
         Args:
             code: Source code
@@ -167,55 +479,63 @@ class AIClient:
         Returns:
             Formatted prompt string
         """
-        prompt = f"""You are an expert code refactoring assistant. Your task is to refactor the provided code according to the specified requirements.
-
-Source File: {filepath}
-Refactoring Goal: {target_description}
-
-Original Code:
-```
-{code}
-```
-
-Please refactor this code according to the goal. Follow these guidelines:
-1. Preserve all functionality while improving code quality
-2. Apply modern best practices and patterns
-3. Improve readability and maintainability
-4. Add appropriate comments where helpful
-5. Ensure the refactored code is production-ready
-
-Provide ONLY the refactored code in your response, without explanations or markdown code blocks unless they are part of the code itself."""
-
-        return prompt
-
-    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return "".join((
+            _PROMPT_HEAD, filepath,
+            _PROMPT_MID1, target_description,
+            _PROMPT_MID2, code,
+            _PROMPT_TAIL,
+        ))
+
+    def _calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0
+    ) -> float:
         """Calculate cost based on token usage.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Cost in USD
         """
         input_cost = (input_tokens / 1_000_000) * self.INPUT_PRICE_PER_1M
+        cache_read_cost = (
+            (cache_read_tokens / 1_000_000) * self.INPUT_PRICE_PER_1M * self.CACHE_READ_MULTIPLIER
+        )
+        cache_write_cost = (
+            (cache_write_tokens / 1_000_000) * self.INPUT_PRICE_PER_1M * self.CACHE_WRITE_MULTIPLIER
+        )
         output_cost = (output_tokens / 1_000_000) * self.OUTPUT_PRICE_PER_1M
 
-        return round(input_cost + output_cost, 6)
+        cost = input_cost + cache_read_cost + cache_write_cost + output_cost
+
+        return round(cost, 6)
 
-    def estimate_cost(self, code: str, target_description: str) -> Dict:
+    def estimate_cost(self, code: str, target_description: str, filepath: str = "") -> Dict:
         """Estimate the cost of refactoring without making the API call.
 
         Args:
             code: Source code
             target_description: Refactoring target
+            filepath: Source file path, as it will appear in the prompt
 
         Returns:
             Dictionary with estimated tokens and cost
         """
-        # Rough estimation: ~4 characters per token
-        estimated_input_tokens = len(code + target_description) // 4
-        estimated_output_tokens = len(code) // 4  # Assume similar length output
+        estimated_input_tokens = self._count_tokens(code, target_description, filepath)
+
+        # Assume the refactored code is about as long as the original, using
+        # the code's share of the prompt to convert characters to tokens
+        prompt_chars = len(SYSTEM_INSTRUCTIONS) + len(
+            self._build_refactor_prompt(code, target_description, filepath)
+        )
+        estimated_output_tokens = estimated_input_tokens * len(code) // max(prompt_chars, 1)
 
         estimated_cost = self._calculate_cost(
             estimated_input_tokens,
@@ -228,3 +548,45 @@ Provide ONLY the refactored code in your response, without explanations or markd
             'estimated_total_tokens': estimated_input_tokens + estimated_output_tokens,
             'estimated_cost': estimated_cost
         }
+
+    def _count_tokens(self, code: str, target_description: str, filepath: str = "") -> int:
+        """Count the input tokens of a refactoring request.
+
+        Uses the Messages token counting endpoint on the exact request that
+        refactor_code() would send, without retries and with a short
+        timeout. Results are cached for the process by a SHA-256 of the
+        prompt; if the endpoint is unreachable, falls back to ~4 characters
+        per token.
+
+        Args:
+            code: Source code
+            target_description: Refactoring target
+            filepath: Source file path
+
+        Returns:
+            Number of input tokens
+        """
+        params = self._build_request_params(code, target_description, filepath)
+        prompt = params['messages'][0]['content']
+        key = hashlib.sha256(f"{self.model}\0{prompt}".encode('utf-8')).hexdigest()
+
+        with _TOKEN_COUNTS_LOCK:
+            if key in _TOKEN_COUNTS:
+                _TOKEN_COUNTS.move_to_end(key)
+                return _TOKEN_COUNTS[key]
+
+        params.pop('max_tokens')
+        try:
+            tokens = self.client.with_options(
+                max_retries=0,
+                timeout=self.TOKEN_COUNT_TIMEOUT
+            ).messages.count_tokens(**params).input_tokens
+        except Exception:
+            # Offline or unsupported: rough estimation, not cached
+            return (len(SYSTEM_INSTRUCTIONS) + len(prompt)) // 4
+
+        with _TOKEN_COUNTS_LOCK:
+            _TOKEN_COUNTS[key] = tokens
+            if len(_TOKEN_COUNTS) > self.TOKEN_CACHE_SIZE:
+                _TOKEN_COUNTS.popitem(last=False)
+        return tokens
@@ -1,14 +1,128 @@
 """Audit logger for tracking all AI governance actions."""
 
+import json
+import os
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, Iterator, List, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional speedup
+    zstandard = None
+
+
+_NS_PER_SECOND = 1_000_000_000
+_SECONDS_PER_DAY = 86_400
+
+# Shared by every insert path so SQLite's per-connection statement cache,
+# which is keyed on the exact SQL text, compiles it only once
+_INSERT_SQL = '''
+    INSERT INTO audit_log
+    (timestamp, filepath, action, status, reason, tokens_used, cost, findings, model, target_description)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_CODE_SQL = '''
+    INSERT INTO audit_log_code (audit_id, codec, original_code, refactored_code)
+    VALUES (?, ?, ?, ?)
+'''
+
+# audit_log columns returned by listing queries by default. Code is kept
+# out of the main table and fetched per entry with get_code().
+LOG_COLUMNS = (
+    'id', 'timestamp', 'filepath', 'action', 'status', 'reason',
+    'tokens_used', 'cost', 'findings', 'model', 'target_description'
+)
+
+# Compression for stored code: zstd when available, zlib otherwise
+_CODE_CODEC = 'zstd' if zstandard is not None else 'zlib'
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+_CACHED_STATEMENTS = 256
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last timestamp
+_timestamp_cache = (None, "")
+
+
+def _compress_code(text: Optional[str]) -> Optional[bytes]:
+    """Compress source text with _CODE_CODEC."""
+    if text is None:
+        return None
+    data = text.encode('utf-8')
+    if _CODE_CODEC == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress_code(codec: str, blob: Optional[bytes]) -> Optional[str]:
+    """Decompress source text stored by _compress_code()."""
+    if blob is None:
+        return None
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError(
+                "This audit entry was compressed with zstd. "
+                "Install the 'zstandard' package to read it."
+            )
+        data = zstandard.ZstdDecompressor().decompress(blob)
+    else:
+        data = zlib.decompress(blob)
+    return data.decode('utf-8')
+
+
+def _utc_timestamp(ns: Optional[int] = None) -> str:
+    """Format a UTC timestamp as ISO-8601 with microseconds.
+
+    The second-resolution prefix is cached so consecutive calls within the
+    same second only format the microseconds. Output sorts lexically in
+    time order, matching datetime.isoformat() for non-zero microseconds.
+
+    Args:
+        ns: Nanoseconds since the epoch. Defaults to now.
+
+    Returns:
+        Timestamp string such as 2025-01-31T12:00:00.123456
+    """
+    global _timestamp_cache
+
+    if ns is None:
+        ns = time.time_ns()
+    sec = ns // _NS_PER_SECOND
+
+    cached_sec, prefix = _timestamp_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _timestamp_cache = (sec, prefix)
+
+    return f"{prefix}.{(ns // 1000) % 1_000_000:06d}"
 
 
 class AuditLogger:
     """Logs all governance actions to SQLite database."""
 
+    # Idle read-only connections kept for reuse by query methods
+    READ_POOL_SIZE = os.cpu_count() or 4
+
+    # Milliseconds a connection waits on a locked database before failing
+    BUSY_TIMEOUT_MS = 5000
+
+    # Statuses written by the tool, counted individually in statistics
+    STATUSES = ('allowed', 'blocked', 'error', 'success')
+
+    # Lookback window, in days, for each named timeframe ('all' has none)
+    TIMEFRAME_DAYS = {'day': 1, 'week': 7, 'month': 30}
+
     def __init__(self, db_path: Optional[str] = None):
         """Initialize audit logger.
 
@@ -19,12 +133,27 @@ class AuditLogger:
             db_path = Path.cwd() / ".ai-governance-audit.db"
 
         self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._readers = queue.Queue()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS
+        )
         self._init_database()
 
     def _init_database(self):
-        """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Initialize the database schema and connection settings."""
+        cursor = self._conn.cursor()
+
+        # WAL lets readers run alongside the writer, and NORMAL sync avoids
+        # an fsync on every autocommitted insert
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA cache_size=-20000")
 
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS audit_log (
@@ -54,8 +183,73 @@ class AuditLogger:
         if 'refactored_code' not in columns:
             cursor.execute('ALTER TABLE audit_log ADD COLUMN refactored_code TEXT')
 
-        conn.commit()
-        conn.close()
+        # Code snapshots live in their own table, compressed, so listing and
+        # aggregate queries on audit_log don't page through source text. The
+        # inline columns above are only read for rows written before this.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS audit_log_code (
+                audit_id INTEGER PRIMARY KEY REFERENCES audit_log(id),
+                codec TEXT NOT NULL,
+                original_code BLOB,
+                refactored_code BLOB
+            )
+        ''')
+
+        # Indexes for status filtering, newest-first listings and action filters
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing_indexes = {row[0] for row in cursor.fetchall()}
+
+        indexes = {
+            'idx_audit_status_ts': 'audit_log(status, timestamp DESC)',
+            'idx_audit_ts': 'audit_log(timestamp DESC)',
+            'idx_audit_action_status': 'audit_log(action, status)',
+        }
+        for name, definition in indexes.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {definition}')
+
+        # Refresh planner statistics once, when an index is first added
+        if not existing_indexes.issuperset(indexes):
+            cursor.execute('ANALYZE audit_log')
+
+    def close(self):
+        """Close all database connections."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool.
+
+        Under WAL, readers see committed data without waiting on the writer
+        lock, so queries from other threads don't serialize behind inserts.
+
+        Yields:
+            sqlite3.Connection opened with mode=ro
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_CACHED_STATEMENTS
+            )
+            conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA cache_size=-20000")
+
+        try:
+            yield conn
+        finally:
+            if self._readers.qsize() < self.READ_POOL_SIZE:
+                self._readers.put(conn)
+            else:
+                conn.close()
 
     def log_action(
         self,
@@ -89,24 +283,90 @@ class AuditLogger:
         Returns:
             Row ID of inserted record
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        row, code = self._build_row(
+            filepath, action, status, reason, tokens_used, cost, findings,
+            model, target_description, original_code, refactored_code
+        )
+
+        with self._lock:
+            if code is None:
+                return self._conn.execute(_INSERT_SQL, row).lastrowid
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row_id = self._write_row(row, code)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+        return row_id
+
+    def log_actions_bulk(self, entries: List[Dict]) -> int:
+        """Log several actions in a single transaction.
 
-        timestamp = datetime.utcnow().isoformat()
+        Args:
+            entries: List of dictionaries with the same keys as log_action()
+                arguments, plus an optional 'timestamp' for actions that
+                happened before they were written
 
-        # Convert findings to string for storage
+        Returns:
+            Number of records inserted
+        """
+        rows = [self._build_row(**entry) for entry in entries]
+        self._insert_rows(rows)
+        return len(rows)
+
+    def _build_row(
+        self,
+        filepath: str,
+        action: str,
+        status: str,
+        reason: Optional[str] = None,
+        tokens_used: int = 0,
+        cost: float = 0.0,
+        findings: Optional[List[Dict]] = None,
+        model: Optional[str] = None,
+        target_description: Optional[str] = None,
+        original_code: Optional[str] = None,
+        refactored_code: Optional[str] = None,
+        timestamp: Optional[str] = None
+    ) -> Tuple[Tuple, Optional[Tuple]]:
+        """Build the insert parameters for a single audit record.
+
+        Returns:
+            Tuple of the audit_log parameters and the compressed code
+            (codec, original, refactored), or None when there is no code
+        """
+        if timestamp is None:
+            timestamp = _utc_timestamp()
+
+        code = None
+        if original_code is not None or refactored_code is not None:
+            code = (
+                _CODE_CODEC,
+                _compress_code(original_code),
+                _compress_code(refactored_code)
+            )
+
+        # Store findings as compact JSON. Only the summary fields are kept:
+        # match examples may contain fragments of the sensitive data itself.
         findings_str = None
         if findings:
-            findings_str = "; ".join([
-                f"{f['pattern']}({f['severity']}): {f['match_count']} matches"
+            summary = [
+                {
+                    'pattern': f['pattern'],
+                    'severity': f['severity'],
+                    'match_count': f['match_count']
+                }
                 for f in findings
-            ])
+            ]
+            if orjson is not None:
+                findings_str = orjson.dumps(summary).decode('utf-8')
+            else:
+                findings_str = json.dumps(summary, separators=(',', ':'))
 
-        cursor.execute('''
-            INSERT INTO audit_log
-            (timestamp, filepath, action, status, reason, tokens_used, cost, findings, model, target_description, original_code, refactored_code)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             timestamp,
             filepath,
             action,
@@ -116,144 +376,241 @@ class AuditLogger:
             cost,
             findings_str,
             model,
-            target_description,
-            original_code,
-            refactored_code
-        ))
+            target_description
+        ), code
+
+    def _insert_rows(self, rows: List[Tuple[Tuple, Optional[Tuple]]]):
+        """Insert rows prepared by _build_row() inside one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if any(code is not None for _, code in rows):
+                    for row, code in rows:
+                        self._write_row(row, code)
+                else:
+                    self._conn.executemany(_INSERT_SQL, [row for row, _ in rows])
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _write_row(self, row: Tuple, code: Optional[Tuple]) -> int:
+        """Insert one audit record and its code. Caller holds the lock."""
+        row_id = self._conn.execute(_INSERT_SQL, row).lastrowid
+        if code is not None:
+            self._conn.execute(_INSERT_CODE_SQL, (row_id,) + code)
+        return row_id
 
-        row_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+    def get_code(self, audit_id: int) -> Optional[Dict]:
+        """Get the code snapshots stored with an audit record.
 
-        return row_id
+        Args:
+            audit_id: ID of the audit record
+
+        Returns:
+            Dictionary with original_code and refactored_code (either may be
+            None), or None if the record does not exist
+        """
+        with self._reader() as conn:
+            row = conn.execute('''
+                SELECT c.codec, c.original_code, c.refactored_code,
+                       l.original_code, l.refactored_code
+                FROM audit_log l
+                LEFT JOIN audit_log_code c ON c.audit_id = l.id
+                WHERE l.id = ?
+            ''', (audit_id,)).fetchone()
+
+        if row is None:
+            return None
+
+        codec, original, refactored, legacy_original, legacy_refactored = row
+        if codec is None:
+            # Written before code moved to audit_log_code
+            return {
+                'original_code': legacy_original,
+                'refactored_code': legacy_refactored
+            }
+
+        return {
+            'original_code': _decompress_code(codec, original),
+            'refactored_code': _decompress_code(codec, refactored)
+        }
 
-    def get_recent_logs(self, limit: int = 50) -> List[Dict]:
+    def get_log_by_id(self, log_id: int, columns: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get a single audit log by its ID.
+
+        Args:
+            log_id: ID of the audit record
+            columns: Columns to return (default: LOG_COLUMNS)
+
+        Returns:
+            Audit log record, or None if it does not exist
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+
+            cursor.execute(f'''
+                SELECT {self._select_list(columns)} FROM audit_log
+                WHERE id = ?
+            ''', (log_id,))
+
+            row = cursor.fetchone()
+
+        return dict(row) if row is not None else None
+
+    def get_recent_logs(self, limit: int = 50, columns: Optional[List[str]] = None) -> List[Dict]:
         """Get recent audit logs.
 
         Args:
             limit: Maximum number of records to return
+            columns: Columns to return (default: LOG_COLUMNS)
 
         Returns:
             List of audit log records
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
-        cursor.execute('''
-            SELECT * FROM audit_log
-            ORDER BY timestamp DESC
-            LIMIT ?
-        ''', (limit,))
+            cursor.execute(f'''
+                SELECT {self._select_list(columns)} FROM audit_log
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (limit,))
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [dict(row) for row in rows]
 
-    def get_logs_by_status(self, status: str, limit: int = 50) -> List[Dict]:
+    def get_logs_by_status(
+        self,
+        status: str,
+        limit: int = 50,
+        columns: Optional[List[str]] = None
+    ) -> List[Dict]:
         """Get logs filtered by status.
 
         Args:
             status: Status to filter by
             limit: Maximum number of records to return
+            columns: Columns to return (default: LOG_COLUMNS)
 
         Returns:
             List of audit log records
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
-        cursor.execute('''
-            SELECT * FROM audit_log
-            WHERE status = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        ''', (status, limit))
+            cursor.execute(f'''
+                SELECT {self._select_list(columns)} FROM audit_log
+                WHERE status = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (status, limit))
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [dict(row) for row in rows]
 
-    def get_statistics(self) -> Dict:
-        """Get audit statistics.
+    def iter_recent_logs(self, limit: int = 50, columns: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Iterate over recent audit logs without building a list.
 
-        Returns:
-            Dictionary with statistics
+        Rows are fetched from the cursor as they are consumed. A pooled
+        connection stays checked out until the iterator is exhausted or
+        closed.
+
+        Args:
+            limit: Maximum number of records to yield
+            columns: Columns to return (default: LOG_COLUMNS)
+
+        Yields:
+            Audit log records, newest first
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
-        # Total counts by status
-        cursor.execute('''
-            SELECT status, COUNT(*) as count
-            FROM audit_log
-            GROUP BY status
-        ''')
-        status_counts = dict(cursor.fetchall())
+            cursor.execute(f'''
+                SELECT {self._select_list(columns)} FROM audit_log
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (limit,))
 
-        # Total cost and tokens
-        cursor.execute('''
-            SELECT
-                SUM(tokens_used) as total_tokens,
-                SUM(cost) as total_cost,
-                COUNT(*) as total_requests
-            FROM audit_log
-        ''')
-        totals = cursor.fetchone()
+            for row in cursor:
+                yield dict(row)
 
-        # Recent activity (last 24 hours)
-        cursor.execute('''
-            SELECT COUNT(*) as recent_count
-            FROM audit_log
-            WHERE datetime(timestamp) > datetime('now', '-1 day')
-        ''')
-        recent = cursor.fetchone()
+    def _select_list(self, columns: Optional[List[str]]) -> str:
+        """Build a validated SELECT column list.
 
-        conn.close()
+        Args:
+            columns: Requested column names, or None for LOG_COLUMNS
+
+        Returns:
+            Comma-separated column list
+
+        Raises:
+            ValueError: If a column is not a listable audit_log column
+        """
+        if columns is None:
+            return ", ".join(LOG_COLUMNS)
+
+        unknown = [column for column in columns if column not in LOG_COLUMNS]
+        if unknown or not columns:
+            raise ValueError(
+                f"Invalid audit log columns: {', '.join(unknown) or '(none)'}. "
+                f"Choose from: {', '.join(LOG_COLUMNS)}"
+            )
+        return ", ".join(columns)
+
+    def get_statistics(self) -> Dict:
+        """Get audit statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        recent_filter, recent_params = self._time_filter('day')
+        stats = self._aggregate("1=1", (), recent_filter, recent_params)
 
         return {
-            'total_requests': totals[2] or 0,
-            'total_tokens': totals[0] or 0,
-            'total_cost': round(totals[1] or 0, 4),
-            'status_counts': status_counts,
-            'recent_24h': recent[0] or 0
+            'total_requests': stats['total_requests'],
+            'total_tokens': stats['total_tokens'],
+            'total_cost': stats['total_cost'],
+            'status_counts': stats['status_counts'],
+            'recent_24h': stats['recent']
         }
 
-    def get_logs_by_timeframe(self, timeframe: str, limit: int = 1000) -> List[Dict]:
+    def get_logs_by_timeframe(
+        self,
+        timeframe: str,
+        limit: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> List[Dict]:
         """Get logs filtered by timeframe.
 
         Args:
             timeframe: Timeframe to filter by (day, week, month, all)
             limit: Maximum number of records to return
+            columns: Columns to return (default: LOG_COLUMNS)
 
         Returns:
             List of audit log records
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        time_filter, params = self._time_filter(timeframe)
 
-        if timeframe == 'day':
-            time_filter = "datetime(timestamp) > datetime('now', '-1 day')"
-        elif timeframe == 'week':
-            time_filter = "datetime(timestamp) > datetime('now', '-7 days')"
-        elif timeframe == 'month':
-            time_filter = "datetime(timestamp) > datetime('now', '-30 days')"
-        else:  # all
-            time_filter = "1=1"
-
-        cursor.execute(f'''
-            SELECT * FROM audit_log
-            WHERE {time_filter}
-            ORDER BY timestamp DESC
-            LIMIT ?
-        ''', (limit,))
-
-        rows = cursor.fetchall()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+
+            cursor.execute(f'''
+                SELECT {self._select_list(columns)} FROM audit_log
+                WHERE {time_filter}
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', params + (limit,))
+
+            rows = cursor.fetchall()
 
         return [dict(row) for row in rows]
 
@@ -266,45 +623,14 @@ class AuditLogger:
         Returns:
             Dictionary with statistics
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if timeframe == 'day':
-            time_filter = "datetime(timestamp) > datetime('now', '-1 day')"
-        elif timeframe == 'week':
-            time_filter = "datetime(timestamp) > datetime('now', '-7 days')"
-        elif timeframe == 'month':
-            time_filter = "datetime(timestamp) > datetime('now', '-30 days')"
-        else:  # all
-            time_filter = "1=1"
-
-        # Total counts by status
-        cursor.execute(f'''
-            SELECT status, COUNT(*) as count
-            FROM audit_log
-            WHERE {time_filter}
-            GROUP BY status
-        ''')
-        status_counts = dict(cursor.fetchall())
-
-        # Total cost and tokens
-        cursor.execute(f'''
-            SELECT
-                SUM(tokens_used) as total_tokens,
-                SUM(cost) as total_cost,
-                COUNT(*) as total_requests
-            FROM audit_log
-            WHERE {time_filter}
-        ''')
-        totals = cursor.fetchone()
-
-        conn.close()
+        time_filter, params = self._time_filter(timeframe)
+        stats = self._aggregate(time_filter, params)
 
         return {
-            'total_requests': totals[2] or 0,
-            'total_tokens': totals[0] or 0,
-            'total_cost': round(totals[1] or 0, 4),
-            'status_counts': status_counts,
+            'total_requests': stats['total_requests'],
+            'total_tokens': stats['total_tokens'],
+            'total_cost': stats['total_cost'],
+            'status_counts': stats['status_counts'],
             'timeframe': timeframe
         }
 
@@ -317,36 +643,28 @@ class AuditLogger:
         Returns:
             List of dictionaries with date, cost, and tokens
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         if timeframe == 'day':
             date_format = "strftime('%Y-%m-%d %H:00', timestamp)"
-            time_filter = "datetime(timestamp) > datetime('now', '-1 day')"
-        elif timeframe == 'week':
+        else:
             date_format = "strftime('%Y-%m-%d', timestamp)"
-            time_filter = "datetime(timestamp) > datetime('now', '-7 days')"
-        elif timeframe == 'month':
-            date_format = "strftime('%Y-%m-%d', timestamp)"
-            time_filter = "datetime(timestamp) > datetime('now', '-30 days')"
-        else:  # all
-            date_format = "strftime('%Y-%m-%d', timestamp)"
-            time_filter = "1=1"
-
-        cursor.execute(f'''
-            SELECT
-                {date_format} as date,
-                SUM(cost) as total_cost,
-                SUM(tokens_used) as total_tokens,
-                COUNT(*) as request_count
-            FROM audit_log
-            WHERE {time_filter}
-            GROUP BY {date_format}
-            ORDER BY date ASC
-        ''')
+        time_filter, params = self._time_filter(timeframe)
+
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        rows = cursor.fetchall()
-        conn.close()
+            cursor.execute(f'''
+                SELECT
+                    {date_format} as date,
+                    SUM(cost) as total_cost,
+                    SUM(tokens_used) as total_tokens,
+                    COUNT(*) as request_count
+                FROM audit_log
+                WHERE {time_filter}
+                GROUP BY {date_format}
+                ORDER BY date ASC
+            ''', params)
+
+            rows = cursor.fetchall()
 
         return [
             {
@@ -358,6 +676,113 @@ class AuditLogger:
             for row in rows
         ]
 
+    def _aggregate(
+        self,
+        time_filter: str,
+        params: Tuple,
+        recent_filter: str = "0",
+        recent_params: Tuple = ()
+    ) -> Dict:
+        """Compute totals and per-status counts in a single pass.
+
+        Args:
+            time_filter: SQL condition selecting the rows to aggregate
+            params: Parameters for time_filter
+            recent_filter: SQL condition for rows counted as recent
+            recent_params: Parameters for recent_filter
+
+        Returns:
+            Dictionary with total_requests, total_tokens, total_cost,
+            status_counts (statuses with no rows omitted) and recent
+        """
+        status_columns = ", ".join(
+            f"SUM(status = '{status}')" for status in self.STATUSES
+        )
+
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(f'''
+                SELECT
+                    SUM(tokens_used),
+                    SUM(cost),
+                    COUNT(*),
+                    SUM({recent_filter}),
+                    {status_columns}
+                FROM audit_log
+                WHERE {time_filter}
+            ''', recent_params + params)
+            row = cursor.fetchone()
+
+            status_counts = {
+                status: count
+                for status, count in zip(self.STATUSES, row[4:])
+                if count
+            }
+
+            # Rows with a status outside STATUSES (e.g. written by another
+            # version) still need to be reported, so count them the slow way
+            if sum(status_counts.values()) != row[2]:
+                cursor.execute(f'''
+                    SELECT status, COUNT(*)
+                    FROM audit_log
+                    WHERE {time_filter}
+                    GROUP BY status
+                ''', params)
+                status_counts = dict(cursor.fetchall())
+
+        return {
+            'total_requests': row[2] or 0,
+            'total_tokens': row[0] or 0,
+            'total_cost': round(row[1] or 0, 4),
+            'status_counts': status_counts,
+            'recent': row[3] or 0
+        }
+
+    def _time_filter(self, timeframe: str) -> Tuple[str, Tuple]:
+        """Build the WHERE clause for a timeframe.
+
+        Compares the raw ISO-8601 column against a cutoff computed in Python
+        rather than wrapping it in datetime(), so the timestamp indexes can
+        be used for a range scan.
+
+        Args:
+            timeframe: Timeframe to filter by (day, week, month, all)
+
+        Returns:
+            Tuple of SQL condition and its parameters
+        """
+        days = self.TIMEFRAME_DAYS.get(timeframe)
+        if days is None:  # all
+            return "1=1", ()
+
+        cutoff = _utc_timestamp(time.time_ns() - days * _SECONDS_PER_DAY * _NS_PER_SECOND)
+        return "timestamp > ?", (cutoff,)
+
+    @staticmethod
+    def format_findings(findings: Optional[str]) -> str:
+        """Render a stored findings value for display.
+
+        Args:
+            findings: Value of the findings column: a JSON list, or the
+                plain-text summary written by older versions
+
+        Returns:
+            Summary such as "api_keys(critical): 2 matches; emails(high): 1 matches"
+        """
+        if not findings:
+            return ""
+
+        try:
+            items = json.loads(findings)
+        except ValueError:
+            return findings  # legacy plain-text summary
+
+        return "; ".join(
+            f"{f['pattern']}({f['severity']}): {f['match_count']} matches"
+            for f in items
+        )
+
     def format_log_entry(self, entry: Dict) -> str:
         """Format a log entry for display.
 
@@ -376,7 +801,7 @@ class AuditLogger:
             lines.append(f"Reason: {entry['reason']}")
 
         if entry.get('findings'):
-            lines.append(f"Findings: {entry['findings']}")
+            lines.append(f"Findings: {self.format_findings(entry['findings'])}")
 
         if entry.get('tokens_used'):
             lines.append(f"Tokens: {entry['tokens_used']} | Cost: ${entry['cost']:.4f}")
@@ -388,3 +813,14 @@ class AuditLogger:
             lines.append(f"Target: {entry['target_description']}")
 
         return "\n".join(lines)
+
+    def format_logs_batch(self, entries: List[Dict]) -> str:
+        """Format several log entries for display as one string.
+
+        Args:
+            entries: List of log entry dictionaries
+
+        Returns:
+            Formatted entries joined by newlines
+        """
+        return "\n".join([self.format_log_entry(entry) for entry in entries])
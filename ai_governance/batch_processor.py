@@ -4,11 +4,42 @@ Batch Processing Module for AI Governance Tool.
 Handles bulk refactoring operations across multiple files.
 """
 
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from colorama import Fore, Style
 
+from .audit_logger import _utc_timestamp
+
+# Progress header pieces, built once rather than per file
+_HEADER_COLOR = Fore.CYAN
+_RESET = Style.RESET_ALL
+_RULE = '-' * 70
+_SEP = '=' * 70
+
+# Scanner used by scan worker processes, built once per process
+_worker_scanner = None
+
+
+def _init_scan_worker(policy_path: str):
+    """Build the scanner for a scan worker process."""
+    global _worker_scanner
+
+    from .policy_engine import PolicyEngine
+    from .scanner import Scanner
+
+    _worker_scanner = Scanner(PolicyEngine(policy_path))
+
+
+def _scan_in_worker(filepath: str) -> Dict[str, Any]:
+    """Scan a file in a scan worker process."""
+    return _worker_scanner.scan_file(filepath, return_content=True)
+
 
 @dataclass
 class BatchResult:
@@ -49,7 +80,7 @@ class BatchResult:
         """Get a summary of the batch operation."""
         lines = [
             f"\n{Fore.CYAN}{Style.BRIGHT}Batch Refactoring Summary{Style.RESET_ALL}",
-            f"{'=' * 70}",
+            _SEP,
             f"Total files:     {self.total_files}",
             f"{Fore.GREEN}Successful:      {self.successful}{Style.RESET_ALL}",
             f"{Fore.RED}Failed:          {self.failed}{Style.RESET_ALL}",
@@ -58,7 +89,7 @@ class BatchResult:
             f"",
             f"Total cost:      ${self.total_cost:.6f}",
             f"Total tokens:    {self.total_tokens}",
-            f"{'=' * 70}\n"
+            _SEP + "\n"
         ]
         return '\n'.join(lines)
 
@@ -66,8 +97,15 @@ class BatchResult:
 class BatchProcessor:
     """Processes multiple files for refactoring."""
 
+    # Buffered audit records are written in one transaction every this many files
+    LOG_FLUSH_EVERY = 100
+
+    # Smallest batch worth starting scan worker processes for
+    PROCESS_SCAN_MIN_FILES = 32
+
     def __init__(self, policy_engine, scanner, ai_client, diff_manager,
-                 audit_logger, no_backup=False, dry_run=False, apply=False):
+                 audit_logger, no_backup=False, dry_run=False, apply=False,
+                 max_concurrency=8, scan_workers=None):
         """
         Initialize BatchProcessor.
 
@@ -80,6 +118,10 @@ class BatchProcessor:
             no_backup: Whether to skip backups
             dry_run: Whether to run in dry-run mode
             apply: Whether to auto-apply changes without confirmation
+            max_concurrency: Maximum number of files processed at once
+            scan_workers: Processes used to scan large batches (default: CPU
+                count). Workers rebuild the scanner from the policy file;
+                0 or 1 scans on the worker threads instead.
         """
         self.policy_engine = policy_engine
         self.scanner = scanner
@@ -89,6 +131,13 @@ class BatchProcessor:
         self.no_backup = no_backup
         self.dry_run = dry_run
         self.apply = apply
+        self.max_concurrency = max(1, max_concurrency)
+        if scan_workers is None:
+            scan_workers = os.cpu_count() or 1
+        self.scan_workers = scan_workers
+        self._use_color = sys.stdout.isatty()
+        self._pending_logs: List[Dict[str, Any]] = []
+        self._log_lock = threading.Lock()
 
     def process_files(self, files: List[Path], target: str,
                       show_progress: bool = True) -> BatchResult:
@@ -108,43 +157,142 @@ class BatchProcessor:
         result = BatchResult()
         result.total_files = len(files)
 
-        for idx, filepath in enumerate(files, 1):
-            if show_progress:
-                click.echo(f"\n{Fore.CYAN}[{idx}/{result.total_files}] Processing: {filepath}{Style.RESET_ALL}")
-                click.echo(f"{'-' * 70}")
+        # Files are processed concurrently, since each one mostly waits on
+        # the API. Workers buffer their output and the main thread prints it
+        # per file as it completes, so lines from different files never mix.
+        # For large batches the CPU-bound scans run in worker processes, and
+        # each file is handed to the thread pool as soon as its scan is done.
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor, \
+                    self._scan_pool(len(files)) as scan_pool:
+                if scan_pool is None:
+                    futures = {
+                        executor.submit(self._process_buffered, str(filepath), target): filepath
+                        for filepath in files
+                    }
+                else:
+                    scan_futures = {
+                        scan_pool.submit(_scan_in_worker, str(filepath)): filepath
+                        for filepath in files
+                    }
+                    futures = {}
+                    for scan_future in as_completed(scan_futures):
+                        filepath = scan_futures[scan_future]
+                        future = executor.submit(
+                            self._process_buffered, str(filepath), target, scan_future.result()
+                        )
+                        futures[future] = filepath
+
+                for idx, future in enumerate(as_completed(futures), 1):
+                    filepath = futures[future]
+                    file_result, messages = future.result()
+
+                    # One write per file: header and messages together
+                    if show_progress:
+                        header = f"[{idx}/{result.total_files}] Processing: {filepath}"
+                        if self._use_color:
+                            header = _HEADER_COLOR + header + _RESET
+                        messages[:0] = ("\n" + header, _RULE)
+                    if messages:
+                        click.echo("\n".join(messages))
+
+                    result.add_result(
+                        filepath=str(filepath),
+                        **file_result
+                    )
+
+                    if idx % self.LOG_FLUSH_EVERY == 0:
+                        self._flush_logs()
+        finally:
+            # Write whatever is left, even if the batch was interrupted
+            self._flush_logs()
+
+        return result
 
-            file_result = self._process_single_file(
-                filepath=str(filepath),
-                target=target
-            )
+    def _scan_pool(self, file_count: int):
+        """Create the scan process pool, or a null context if not worth it."""
+        if self.scan_workers <= 1 or file_count < self.PROCESS_SCAN_MIN_FILES:
+            return nullcontext()
 
-            result.add_result(
-                filepath=str(filepath),
-                **file_result
-            )
+        return ProcessPoolExecutor(
+            max_workers=min(self.scan_workers, file_count),
+            initializer=_init_scan_worker,
+            initargs=(str(self.policy_engine.policy_path),)
+        )
 
-        return result
+    def _process_buffered(self, filepath: str, target: str,
+                          scan_result: Optional[Dict[str, Any]] = None
+                          ) -> Tuple[Dict[str, Any], List[str]]:
+        """Process a file on a worker thread, collecting its output.
 
-    def _process_single_file(self, filepath: str, target: str) -> Dict[str, Any]:
+        Args:
+            filepath: Path to the file
+            target: Refactoring target description
+            scan_result: Result of scanning the file, if already scanned
+
+        Returns:
+            Tuple of the processing result and the messages to print
+        """
+        messages: List[str] = []
+        if scan_result is None:
+            file_result = self._process_single_file(filepath, target, echo=messages.append)
+        else:
+            file_result = self._refactor_phase(filepath, scan_result, target, echo=messages.append)
+        return file_result, messages
+
+    def _log(self, **kwargs):
+        """Buffer an audit record, stamped now, for the next bulk write."""
+        entry = {'timestamp': _utc_timestamp(), **kwargs}
+        with self._log_lock:
+            self._pending_logs.append(entry)
+
+    def _flush_logs(self):
+        """Write buffered audit records in a single transaction."""
+        with self._log_lock:
+            entries, self._pending_logs = self._pending_logs, []
+        if entries:
+            self.audit_logger.log_actions_bulk(entries)
+
+    def _process_single_file(self, filepath: str, target: str,
+                             echo: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Process a single file for refactoring.
 
         Args:
             filepath: Path to the file
             target: Refactoring target description
+            echo: Function used to output messages (default: click.echo)
 
         Returns:
             Dictionary with processing result
         """
-        import click
-
         # Scan file
-        scan_result = self.scanner.scan_file(filepath)
+        scan_result = self.scanner.scan_file(filepath, return_content=True)
+
+        return self._refactor_phase(filepath, scan_result, target, echo=echo)
+
+    def _refactor_phase(self, filepath: str, scan_result: Dict[str, Any], target: str,
+                        echo: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Act on a file's scan result: log blocked files, refactor allowed ones.
+
+        Args:
+            filepath: Path to the file
+            scan_result: Result of Scanner.scan_file() for the file
+            target: Refactoring target description
+            echo: Function used to output messages (default: click.echo)
+
+        Returns:
+            Dictionary with processing result
+        """
+        if echo is None:
+            import click
+            echo = click.echo
 
         # Handle errors
         if scan_result.get('error'):
-            click.echo(f"{Fore.RED}❌ ERROR: {scan_result['reason']}{Style.RESET_ALL}")
-            self.audit_logger.log_action(
+            echo(f"{Fore.RED}❌ ERROR: {scan_result['reason']}{Style.RESET_ALL}")
+            self._log(
                 filepath=filepath,
                 action='refactor',
                 status='error',
@@ -157,10 +305,10 @@ class BatchProcessor:
 
         # Handle blocked files
         if not scan_result['allowed']:
-            click.echo(f"{Fore.YELLOW}🚫 BLOCKED: {scan_result['reason']}{Style.RESET_ALL}")
+            echo(f"{Fore.YELLOW}🚫 BLOCKED: {scan_result['reason']}{Style.RESET_ALL}")
 
             # Log blocked attempt
-            self.audit_logger.log_action(
+            self._log(
                 filepath=filepath,
                 action='refactor',
                 status='blocked',
@@ -176,11 +324,11 @@ class BatchProcessor:
             }
 
         # File passed security checks
-        click.echo(f"{Fore.GREEN}✅ PASSED security scan{Style.RESET_ALL}")
+        echo(f"{Fore.GREEN}✅ PASSED security scan{Style.RESET_ALL}")
 
         if self.dry_run:
-            click.echo(f"{Fore.YELLOW}Dry run - skipping refactoring{Style.RESET_ALL}")
-            self.audit_logger.log_action(
+            echo(f"{Fore.YELLOW}Dry run - skipping refactoring{Style.RESET_ALL}")
+            self._log(
                 filepath=filepath,
                 action='scan',
                 status='allowed',
@@ -200,8 +348,8 @@ class BatchProcessor:
             )
 
             if not result['success']:
-                click.echo(f"{Fore.RED}❌ Refactoring failed: {result['error']}{Style.RESET_ALL}")
-                self.audit_logger.log_action(
+                echo(f"{Fore.RED}❌ Refactoring failed: {result['error']}{Style.RESET_ALL}")
+                self._log(
                     filepath=filepath,
                     action='refactor',
                     status='error',
@@ -215,11 +363,11 @@ class BatchProcessor:
                 }
 
             # Success!
-            click.echo(f"{Fore.GREEN}✅ Refactored - Cost: ${result['cost']:.6f}, "
-                      f"Tokens: {result['tokens_used']['total']}{Style.RESET_ALL}")
+            echo(f"{Fore.GREEN}✅ Refactored - Cost: ${result['cost']:.6f}, "
+                 f"Tokens: {result['tokens_used']['total']}{Style.RESET_ALL}")
 
             # Log success
-            self.audit_logger.log_action(
+            self._log(
                 filepath=filepath,
                 action='refactor',
                 status='success',
@@ -234,17 +382,15 @@ class BatchProcessor:
 
             # Apply changes if in batch mode (we auto-apply in batch)
             if self.apply:
-                # Create backup
-                if not self.no_backup:
-                    backup_path = self.diff_manager.create_backup(filepath)
-                    if backup_path:
-                        click.echo(f"{Fore.BLUE}Backup: {backup_path}{Style.RESET_ALL}")
-
-                # Save refactored code
-                if self.diff_manager.save_refactored(filepath, result['refactored_code']):
-                    click.echo(f"{Fore.GREEN}Applied changes to {filepath}{Style.RESET_ALL}")
+                # Swap in the refactored code, keeping the original as backup
+                applied = self.diff_manager.apply_with_backup(filepath, result['refactored_code'])
+                if applied['backup_path']:
+                    echo(f"{Fore.BLUE}Backup: {applied['backup_path']}{Style.RESET_ALL}")
+
+                if applied['success']:
+                    echo(f"{Fore.GREEN}Applied changes to {filepath}{Style.RESET_ALL}")
                 else:
-                    click.echo(f"{Fore.RED}Failed to save changes{Style.RESET_ALL}")
+                    echo(f"{Fore.RED}Failed to save changes: {applied['error']}{Style.RESET_ALL}")
                     return {
                         'status': 'failed',
                         'reason': 'Failed to save changes'
@@ -258,7 +404,7 @@ class BatchProcessor:
             }
 
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}{Style.RESET_ALL}")
+            echo(f"{Fore.RED}❌ Error: {str(e)}{Style.RESET_ALL}")
             return {
                 'status': 'failed',
                 'reason': str(e)
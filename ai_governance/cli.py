@@ -1,77 +1,229 @@
 """Command-line interface for AI Governance Tool."""
 
 import click
+import functools
 import os
+import sys
 from pathlib import Path
+from typing import Tuple
 from colorama import Fore, Style, init
 from dotenv import load_dotenv
 
-from .policy_engine import PolicyEngine
-from .scanner import Scanner
-from .ai_client import AIClient
-from .diff_manager import DiffManager
-from .audit_logger import AuditLogger
-from .file_discoverer import FileDiscoverer
-from .batch_processor import BatchProcessor
-from .language_config import (
-    get_extensions_for_languages,
-    parse_extensions,
-    get_supported_languages,
-    get_all_extensions
+from .color import _NoColor
+
+# Package components (anthropic, yaml, sqlite3, language tables, ...) are
+# imported inside the commands that use them, so --version, --help and
+# light commands start quickly
+
+
+class _Lazy:
+    """Build a component on first call and return the same instance after.
+
+    Lets a command skip constructing components (the DiffManager, for
+    example) on paths that exit before using them.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = self._MISSING
+
+    def __call__(self):
+        if self._value is self._MISSING:
+            self._value = self._factory()
+        return self._value
+
+
+# --version and --help print only plain text, so they skip colorama setup
+_PLAIN_TEXT_ARGS = frozenset({'--version', '--help'})
+
+# Initialize colorama only for interactive output; when piped or NO_COLOR
+# is set, color codes become empty strings instead
+if sys.stdout.isatty() and not os.environ.get('NO_COLOR'):
+    if _PLAIN_TEXT_ARGS.isdisjoint(sys.argv[1:]):
+        init(autoreset=True)
+else:
+    Fore = Style = _NoColor()
+
+# ANSI codes bound once as plain strings (all '' when color is off)
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_BRIGHT = Style.BRIGHT
+_DIM = Style.DIM
+_RESET = Style.RESET_ALL
+
+_SEP = '=' * 70
+
+# Parameter types shared by the command decorators
+_EXISTING_PATH = click.Path(exists=True)
+_AUDIT_STATUS = click.Choice(['allowed', 'blocked', 'error', 'success'])
+
+# Empty values and template placeholders that are never real API keys
+_INVALID_KEYS = frozenset({'', 'your_api_key_here', 'your_key_here', 'YOUR_API_KEY', 'sk-...'})
+
+
+def _out(text: str):
+    """Write pre-formatted text straight to stdout.
+
+    Used for the status lines in refactor(), which already carry their own
+    color codes and newline, so click.echo's per-call handling is skipped.
+    sys.stdout is looked up on each call so redirected streams still work.
+    """
+    sys.stdout.write(text)
+
+
+def _banner(title: str) -> str:
+    """Build a command's heading and separator (written with one echo)."""
+    return f"\n{_CYAN}{_BRIGHT}AI Governance Tool - {title}{_RESET}\n{_SEP}\n"
+
+
+_BANNER_REFACTOR = _banner("Refactor")
+_BANNER_BULK_REFACTOR = _banner("Bulk Refactor")
+_BANNER_INIT = _banner("Initialization")
+_BANNER_AUDIT = _banner("Audit Logs")
+_BANNER_DASHBOARD = _banner("Dashboard")
+_HEADER_LANGUAGES = f"\n{_CYAN}{_BRIGHT}Supported Programming Languages{_RESET}\n{_SEP}\n\n"
+_FOOTER_LANGUAGES = (
+    f"\n\n{_YELLOW}Usage:{_RESET}\n"
+    "  --lang python              (refactor Python files)\n"
+    "  --lang python --lang java  (refactor Python and Java)\n"
+    "  --ext py,js,ts             (refactor specific extensions)\n"
 )
 
-# Initialize colorama
-init(autoreset=True)
 
-# Load environment variables from current directory only
-# This allows users to optionally set API keys via .env files
-# but the tool itself never creates these files for security
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _ensure_dotenv_loaded():
+    """Load environment variables from a .env in the current directory, once.
+
+    This allows users to optionally set API keys via .env files, but the
+    tool itself never creates these files for security. Only commands that
+    need the API key call this, so audit, dashboard and --help skip the
+    file lookup entirely.
+    """
+    # Open the one place we look instead of letting find_dotenv() walk up
+    # the directory tree; a missing file costs a single failed open()
+    try:
+        with open('.env', encoding='utf-8') as stream:
+            load_dotenv(stream=stream, override=False)
+    except (FileNotFoundError, IsADirectoryError):
+        pass
+    _get_api_key.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read ANTHROPIC_API_KEY from the environment, once.
+
+    Call _get_api_key.cache_clear() after changing the variable.
+    """
+    return os.environ.get('ANTHROPIC_API_KEY', '')
+
+
+def _resolve_api_key() -> Tuple[bool, str]:
+    """Look up the API key once and report whether it is usable.
+
+    Shared by ensure_api_key() and init() so both apply the same
+    placeholder rules.
+
+    Returns:
+        Tuple of (key is set and not a placeholder, raw value)
+    """
+    key = _get_api_key()
+    return key not in _INVALID_KEYS, key
+
 
+def _yn(prompt: str, default: bool = True) -> bool:
+    """Ask a yes/no question on stdin.
 
+    A lightweight stand-in for click.confirm for the setup prompts, with
+    the same prompt format and answers.
+
+    Args:
+        prompt: Question to ask
+        default: Answer used when the user just presses Enter
+
+    Returns:
+        True for yes, False for no
+    """
+    suffix = " [Y/n]: " if default else " [y/N]: "
+    while True:
+        try:
+            answer = input(prompt + suffix).strip().lower()
+        except EOFError:
+            raise click.Abort()
+
+        if not answer:
+            return default
+        if answer in ('y', 'yes'):
+            return True
+        if answer in ('n', 'no'):
+            return False
+        click.echo("Error: invalid input")
+
+
+@functools.lru_cache(maxsize=1)
 def ensure_api_key() -> bool:
     """Ensure API key is configured. Prompt user if not found.
 
+    The result is cached for the life of the process.
+
     Returns:
         True if API key is available, False otherwise
     """
     # Check if API key is already set
-    if os.getenv('ANTHROPIC_API_KEY') and os.getenv('ANTHROPIC_API_KEY') != 'your_api_key_here':
+    configured, _ = _resolve_api_key()
+    if configured:
         return True
 
+    # Without a terminal there is nobody to prompt
+    if not sys.stdin.isatty():
+        return False
+
     # API key not found, prompt user
-    click.echo(f"\n{Fore.YELLOW}⚠️  Anthropic API key not found{Style.RESET_ALL}\n")
-    click.echo("To use AI refactoring, you need an Anthropic API key.")
-    click.echo("Get your key from: https://console.anthropic.com/\n")
+    click.echo("\n".join([
+        f"\n{_YELLOW}⚠️  Anthropic API key not found{_RESET}\n",
+        "To use AI refactoring, you need an Anthropic API key.",
+        "Get your key from: https://console.anthropic.com/\n",
+    ]))
 
     # Ask if they want to configure it now
-    if not click.confirm("Would you like to configure it now?", default=True):
-        click.echo(f"\n{Fore.CYAN}You can configure it later by running:{Style.RESET_ALL}")
-        click.echo("  ai-governance init\n")
+    if not _yn("Would you like to configure it now?", default=True):
+        click.echo("\n".join([
+            f"\n{_CYAN}You can configure it later by running:{_RESET}",
+            "  ai-governance init\n",
+        ]))
         return False
 
     # Prompt for API key (hide input for security)
     api_key = click.prompt(
-        f"\n{Fore.CYAN}Enter your Anthropic API key{Style.RESET_ALL}",
+        f"\n{_CYAN}Enter your Anthropic API key{_RESET}",
         hide_input=True,
-        type=str
-    ).strip()
+        value_proc=str.strip
+    )
 
     # Basic validation
-    if not api_key or api_key == 'your_api_key_here':
-        click.echo(f"\n{Fore.RED}Invalid API key provided{Style.RESET_ALL}")
+    if api_key in _INVALID_KEYS:
+        click.echo(f"\n{_RED}Invalid API key provided{_RESET}")
         return False
 
     # Set it for current session only (more secure)
     os.environ['ANTHROPIC_API_KEY'] = api_key
+    _get_api_key.cache_clear()
 
-    click.echo(f"\n{Fore.GREEN}✅ API key set for this session{Style.RESET_ALL}")
-    click.echo(f"{Fore.YELLOW}Note: For security, the key is NOT saved to disk.{Style.RESET_ALL}")
-    click.echo(f"{Fore.CYAN}You'll be prompted again in the next session.{Style.RESET_ALL}\n")
+    click.echo("\n".join([
+        f"\n{_GREEN}✅ API key set for this session{_RESET}",
+        f"{_YELLOW}Note: For security, the key is NOT saved to disk.{_RESET}",
+        f"{_CYAN}You'll be prompted again in the next session.{_RESET}\n",
+    ]))
 
     # Show how to set it permanently via environment if they want
-    click.echo(f"{Fore.DIM}Tip: To avoid re-entering, set environment variable:{Style.RESET_ALL}")
-    click.echo(f"{Fore.DIM}  export ANTHROPIC_API_KEY='your_key_here'{Style.RESET_ALL}\n")
+    click.echo("\n".join([
+        f"{_DIM}Tip: To avoid re-entering, set environment variable:{_RESET}",
+        f"{_DIM}  export ANTHROPIC_API_KEY='your_key_here'{_RESET}\n",
+    ]))
 
     return True
 
@@ -91,7 +243,7 @@ def cli():
 
 
 @cli.command()
-@click.argument('filepath', type=click.Path(exists=True))
+@click.argument('filepath', type=_EXISTING_PATH)
 @click.option(
     '--target',
     '-t',
@@ -101,7 +253,7 @@ def cli():
 @click.option(
     '--policy',
     '-p',
-    type=click.Path(exists=True),
+    type=_EXISTING_PATH,
     help='Path to policy YAML file (default: profiles/default-secure.yaml)'
 )
 @click.option(
@@ -125,31 +277,39 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
     Example:
         ai-governance refactor demo/legacy_code/utils.py --target "modernize to Python 3.10+"
     """
-    click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}AI Governance Tool - Refactor{Style.RESET_ALL}")
-    click.echo(f"{'=' * 70}\n")
+    _ensure_dotenv_loaded()
+    _out(_BANNER_REFACTOR + "\n")
+
+    from .policy_engine import PolicyEngine
+    from .scanner import Scanner
+    from .ai_client import AIClient
+    from .diff_manager import DiffManager
+    from .audit_logger import AuditLogger
 
     # Initialize components
     try:
-        policy_engine = PolicyEngine(policy)
+        policy_engine = PolicyEngine(policy, use_cache=True)
         scanner = Scanner(policy_engine)
+        # Built up front: nothing may be sent to the AI unless the call can
+        # be audited
         audit_logger = AuditLogger()
-        diff_manager = DiffManager(create_backups=not no_backup)
+        diff_manager = _Lazy(lambda: DiffManager(create_backups=not no_backup))
     except Exception as e:
-        click.echo(f"{Fore.RED}Error initializing components: {e}{Style.RESET_ALL}")
+        _out(f"{_RED}Error initializing components: {e}{_RESET}\n")
         return
 
     # Show policy info
-    policy_info = policy_engine.get_policy_info()
-    click.echo(f"{Fore.YELLOW}Policy: {policy_info['name']} (v{policy_info['version']}){Style.RESET_ALL}")
-    click.echo(f"Description: {policy_info['description']}\n")
+    policy_info = policy_engine.policy_info
+    _out(f"{_YELLOW}Policy: {policy_info['name']} (v{policy_info['version']}){_RESET}\n")
+    _out(f"Description: {policy_info['description']}\n\n")
 
     # Scan file
-    click.echo(f"{Fore.CYAN}Scanning file: {filepath}{Style.RESET_ALL}")
-    scan_result = scanner.scan_file(filepath)
+    _out(f"{_CYAN}Scanning file: {filepath}{_RESET}\n")
+    scan_result = scanner.scan_file(filepath, return_content=True)
 
     # Display scan results
     if scan_result.get('error'):
-        click.echo(f"\n{Fore.RED}❌ ERROR: {scan_result['reason']}{Style.RESET_ALL}")
+        _out(f"\n{_RED}❌ ERROR: {scan_result['reason']}{_RESET}\n")
         audit_logger.log_action(
             filepath=filepath,
             action='refactor',
@@ -159,16 +319,18 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
         return
 
     if not scan_result['allowed']:
-        click.echo(f"\n{Fore.RED}🚫 BLOCKED: {scan_result['reason']}{Style.RESET_ALL}")
-        click.echo(f"File size: {scan_result['file_size']} bytes\n")
+        _out(f"\n{_RED}🚫 BLOCKED: {scan_result['reason']}{_RESET}\n")
+        _out(f"File size: {scan_result['file_size']} bytes\n\n")
 
         if scan_result['findings']:
-            click.echo(f"{Fore.YELLOW}Sensitive patterns detected:{Style.RESET_ALL}")
+            # Format every finding first, then write the block in one call
+            lines = [f"{_YELLOW}Sensitive patterns detected:{_RESET}"]
             for finding in scan_result['findings']:
-                click.echo(f"  • {Fore.RED}{finding['pattern']}{Style.RESET_ALL} "
-                          f"({finding['severity']}): {finding['description']}")
-                click.echo(f"    Matches: {finding['match_count']}, "
-                          f"Examples: {', '.join(finding['examples'])}")
+                lines.append(f"  • {_RED}{finding['pattern']}{_RESET} "
+                             f"({finding['severity']}): {finding['description']}")
+                lines.append(f"    Matches: {finding['match_count']}, "
+                             f"Examples: {', '.join(finding['examples'])}")
+            _out('\n'.join(lines) + '\n')
 
         # Log blocked attempt
         audit_logger.log_action(
@@ -180,15 +342,15 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
             target_description=target
         )
 
-        click.echo(f"\n{Fore.YELLOW}⚠️  File blocked by security policy. Not sent to AI.{Style.RESET_ALL}")
+        _out(f"\n{_YELLOW}⚠️  File blocked by security policy. Not sent to AI.{_RESET}\n")
         return
 
     # File passed security checks
-    click.echo(f"\n{Fore.GREEN}✅ PASSED: {scan_result['reason']}{Style.RESET_ALL}")
-    click.echo(f"File size: {scan_result['file_size']} bytes")
+    _out(f"\n{_GREEN}✅ PASSED: {scan_result['reason']}{_RESET}\n")
+    _out(f"File size: {scan_result['file_size']} bytes\n")
 
     if dry_run:
-        click.echo(f"\n{Fore.YELLOW}Dry run mode - stopping before refactoring{Style.RESET_ALL}")
+        _out(f"\n{_YELLOW}Dry run mode - stopping before refactoring{_RESET}\n")
         audit_logger.log_action(
             filepath=filepath,
             action='scan',
@@ -199,31 +361,43 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
 
     # Ensure API key is configured before making AI calls
     if not ensure_api_key():
-        click.echo(f"\n{Fore.RED}Cannot proceed without API key{Style.RESET_ALL}")
+        _out(f"\n{_RED}Cannot proceed without API key{_RESET}\n")
         return
 
     # Refactor with AI
-    click.echo(f"\n{Fore.CYAN}Refactoring with AI...{Style.RESET_ALL}")
-    click.echo(f"Target: {target}")
+    _out(f"\n{_CYAN}Refactoring with AI...{_RESET}\n")
+    _out(f"Target: {target}\n")
 
     try:
         ai_client = AIClient()
-        click.echo(f"Model: {ai_client.model}\n")
+        _out(f"Model: {ai_client.model}\n\n")
+
+        # Estimate cost first, unless --apply means nobody is deciding on it
+        if not apply:
+            estimate = ai_client.estimate_cost(scan_result['content'], target, filepath)
+            _out(f"{_YELLOW}Estimated cost: ${estimate['estimated_cost']:.4f}{_RESET}\n")
+            _out(f"Estimated tokens: ~{estimate['estimated_total_tokens']}\n\n")
 
-        # Estimate cost first
-        estimate = ai_client.estimate_cost(scan_result['content'], target)
-        click.echo(f"{Fore.YELLOW}Estimated cost: ${estimate['estimated_cost']:.4f}{Style.RESET_ALL}")
-        click.echo(f"Estimated tokens: ~{estimate['estimated_total_tokens']}\n")
+        # Call AI, printing a progress dot roughly every 1KB of streamed output
+        received = [0]
+
+        def show_progress(text):
+            before = received[0] // 1024
+            received[0] += len(text)
+            if received[0] // 1024 > before:
+                click.echo('.', nl=False)
 
-        # Call AI
         result = ai_client.refactor_code(
             code=scan_result['content'],
             target_description=target,
-            filepath=filepath
+            filepath=filepath,
+            on_chunk=show_progress
         )
+        if received[0] >= 1024:
+            click.echo()
 
         if not result['success']:
-            click.echo(f"{Fore.RED}Error during refactoring: {result['error']}{Style.RESET_ALL}")
+            _out(f"{_RED}Error during refactoring: {result['error']}{_RESET}\n")
             audit_logger.log_action(
                 filepath=filepath,
                 action='refactor',
@@ -235,22 +409,22 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
             return
 
         # Display results
-        click.echo(f"{Fore.GREEN}✅ Refactoring completed!{Style.RESET_ALL}\n")
-        click.echo(f"{Fore.YELLOW}Tokens used: {result['tokens_used']['total']}{Style.RESET_ALL}")
-        click.echo(f"  Input:  {result['tokens_used']['input']}")
-        click.echo(f"  Output: {result['tokens_used']['output']}")
-        click.echo(f"{Fore.YELLOW}Actual cost: ${result['cost']:.6f}{Style.RESET_ALL}\n")
-
-        # Show diff
-        diff_manager.display_diff(
+        tokens = result['tokens_used']
+        _out(
+            f"{_GREEN}✅ Refactoring completed!{_RESET}\n\n"
+            f"{_YELLOW}Tokens used: {tokens['total']}{_RESET}\n"
+            f"  Input:  {tokens['input']}\n"
+            f"  Output: {tokens['output']}\n"
+            f"{_YELLOW}Actual cost: ${result['cost']:.6f}{_RESET}\n\n"
+        )
+
+        # Show diff and stats
+        stats = diff_manager().display_diff(
             original=scan_result['content'],
             refactored=result['refactored_code'],
             filepath=filepath
         )
-
-        # Show stats
-        stats = diff_manager.get_stats(scan_result['content'], result['refactored_code'])
-        diff_manager.display_stats(stats)
+        diff_manager().display_stats(stats)
 
         # Log success
         audit_logger.log_action(
@@ -267,26 +441,25 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
         )
 
         # Ask to apply changes (unless --apply flag is set)
-        if apply or click.confirm(f"\n{Fore.CYAN}Apply changes to {filepath}?{Style.RESET_ALL}"):
-            # Create backup
-            if not no_backup:
-                backup_path = diff_manager.create_backup(filepath)
-                if backup_path:
-                    click.echo(f"{Fore.GREEN}Backup created: {backup_path}{Style.RESET_ALL}")
-
-            # Save refactored code
-            if diff_manager.save_refactored(filepath, result['refactored_code']):
-                click.echo(f"{Fore.GREEN}✅ Changes applied to {filepath}{Style.RESET_ALL}")
+        if apply or click.confirm(f"\n{_CYAN}Apply changes to {filepath}?{_RESET}"):
+            # Swap in the refactored code, keeping the original as backup
+            applied = diff_manager().apply_with_backup(filepath, result['refactored_code'])
+            if applied['backup_path']:
+                _out(f"{_GREEN}Backup created: {applied['backup_path']}{_RESET}\n")
+
+            if applied['success']:
+                _out(f"{_GREEN}✅ Changes applied to {filepath}{_RESET}\n")
             else:
-                click.echo(f"{Fore.RED}❌ Failed to save changes{Style.RESET_ALL}")
+                _out(f"{_RED}Error saving file: {applied['error']}{_RESET}\n")
+                _out(f"{_RED}❌ Failed to save changes{_RESET}\n")
         else:
-            click.echo(f"{Fore.YELLOW}Changes not applied{Style.RESET_ALL}")
+            _out(f"{_YELLOW}Changes not applied{_RESET}\n")
 
     except ValueError as e:
-        click.echo(f"\n{Fore.RED}Configuration error: {e}{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}Set ANTHROPIC_API_KEY environment variable{Style.RESET_ALL}")
+        _out(f"\n{_RED}Configuration error: {e}{_RESET}\n")
+        _out(f"{_YELLOW}Set ANTHROPIC_API_KEY environment variable{_RESET}\n")
     except Exception as e:
-        click.echo(f"\n{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        _out(f"\n{_RED}Error: {e}{_RESET}\n")
 
 
 @cli.command()
@@ -299,7 +472,7 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
 @click.option(
     '--policy',
     '-p',
-    type=click.Path(exists=True),
+    type=_EXISTING_PATH,
     help='Path to policy YAML file (default: profiles/default-secure.yaml)'
 )
 @click.option(
@@ -344,8 +517,15 @@ def refactor(filepath, target, policy, no_backup, dry_run, apply):
     is_flag=True,
     help='List all supported languages and exit'
 )
+@click.option(
+    '--concurrency',
+    '-j',
+    type=click.IntRange(min=1),
+    default=8,
+    help='Number of files to process in parallel (default: 8)'
+)
 def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, pattern,
-                  languages, extensions, list_languages):
+                  languages, extensions, list_languages, concurrency):
     """Refactor multiple files or entire directories using AI.
 
     Supports all common programming languages (Python, JavaScript, TypeScript, Java, C++, Go, Rust, etc.)
@@ -380,48 +560,49 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
         # Auto-apply changes without confirmation
         ai-governance bulk-refactor src/ --target "..." --apply
     """
+    _ensure_dotenv_loaded()
+
     # Handle --list-languages flag
     if list_languages:
-        click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}Supported Programming Languages{Style.RESET_ALL}")
-        click.echo(f"{'=' * 70}\n")
-        supported_langs = get_supported_languages()
-
-        # Display in columns
-        from .language_config import LANGUAGE_EXTENSIONS
-        for i, lang in enumerate(supported_langs, 1):
-            exts = ', '.join(sorted(LANGUAGE_EXTENSIONS[lang]))
-            click.echo(f"{i:2}. {lang:15} - {exts}")
-
-        click.echo(f"\n{Fore.YELLOW}Usage:{Style.RESET_ALL}")
-        click.echo(f"  --lang python              (refactor Python files)")
-        click.echo(f"  --lang python --lang java  (refactor Python and Java)")
-        click.echo(f"  --ext py,js,ts             (refactor specific extensions)")
-        click.echo()
+        from .language_config import render_language_table
+        click.echo(_HEADER_LANGUAGES + render_language_table() + _FOOTER_LANGUAGES)
         return
 
     # Validate that --target is provided
     if not target:
-        click.echo(f"{Fore.RED}Error: --target/-t is required{Style.RESET_ALL}")
+        click.echo(f"{_RED}Error: --target/-t is required{_RESET}")
         click.echo(f"\nUsage: ai-governance bulk-refactor PATHS --target \"description\"")
         click.echo(f"       ai-governance bulk-refactor --list-languages")
         return
 
-    click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}AI Governance Tool - Bulk Refactor{Style.RESET_ALL}")
-    click.echo(f"{'=' * 70}\n")
+    click.echo(_BANNER_BULK_REFACTOR)
+
+    from .policy_engine import PolicyEngine
+    from .scanner import Scanner
+    from .ai_client import AIClient
+    from .diff_manager import DiffManager
+    from .audit_logger import AuditLogger
+    from .file_discoverer import FileDiscoverer
+    from .batch_processor import BatchProcessor
+    from .language_config import (
+        get_extensions_for_languages,
+        parse_extensions,
+        get_all_extensions
+    )
 
     # Initialize components
     try:
-        policy_engine = PolicyEngine(policy)
+        policy_engine = PolicyEngine(policy, use_cache=True)
         scanner = Scanner(policy_engine)
         audit_logger = AuditLogger()
         diff_manager = DiffManager(create_backups=not no_backup)
     except Exception as e:
-        click.echo(f"{Fore.RED}Error initializing components: {e}{Style.RESET_ALL}")
+        click.echo(f"{_RED}Error initializing components: {e}{_RESET}")
         return
 
     # Show policy info
-    policy_info = policy_engine.get_policy_info()
-    click.echo(f"{Fore.YELLOW}Policy: {policy_info['name']} (v{policy_info['version']}){Style.RESET_ALL}")
+    policy_info = policy_engine.policy_info
+    click.echo(f"{_YELLOW}Policy: {policy_info['name']} (v{policy_info['version']}){_RESET}")
     click.echo(f"Description: {policy_info['description']}\n")
 
     # Determine file extensions to process
@@ -429,25 +610,25 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
     if extensions:
         # User specified custom extensions
         supported_extensions = parse_extensions(extensions)
-        click.echo(f"{Fore.CYAN}File extensions: {', '.join(sorted(supported_extensions))}{Style.RESET_ALL}")
+        click.echo(f"{_CYAN}File extensions: {', '.join(sorted(supported_extensions))}{_RESET}")
     elif languages:
         # User specified languages
         try:
-            supported_extensions = get_extensions_for_languages(list(languages))
-            click.echo(f"{Fore.CYAN}Languages: {', '.join(languages)}{Style.RESET_ALL}")
-            click.echo(f"File extensions: {', '.join(sorted(supported_extensions))}{Style.RESET_ALL}")
+            supported_extensions = get_extensions_for_languages(frozenset(languages))
+            click.echo(f"{_CYAN}Languages: {', '.join(languages)}{_RESET}")
+            click.echo(f"File extensions: {', '.join(sorted(supported_extensions))}{_RESET}")
         except ValueError as e:
-            click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-            click.echo(f"\n{Fore.YELLOW}Use --list-languages to see supported languages{Style.RESET_ALL}")
+            click.echo(f"{_RED}Error: {e}{_RESET}")
+            click.echo(f"\n{_YELLOW}Use --list-languages to see supported languages{_RESET}")
             return
     else:
         # No language or extension specified - use all supported languages
         supported_extensions = get_all_extensions()
-        click.echo(f"{Fore.CYAN}Processing all supported file types{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}Tip: Use --lang or --ext to filter specific languages{Style.RESET_ALL}")
+        click.echo(f"{_CYAN}Processing all supported file types{_RESET}")
+        click.echo(f"{_YELLOW}Tip: Use --lang or --ext to filter specific languages{_RESET}")
 
     # Discover files
-    click.echo(f"\n{Fore.CYAN}Discovering files...{Style.RESET_ALL}")
+    click.echo(f"\n{_CYAN}Discovering files...{_RESET}")
     discoverer = FileDiscoverer(supported_extensions=supported_extensions)
     files = discoverer.discover_files(
         paths=list(paths),
@@ -456,23 +637,22 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
     )
 
     if not files:
-        click.echo(f"{Fore.YELLOW}No files found matching criteria{Style.RESET_ALL}")
+        click.echo(f"{_YELLOW}No files found matching criteria{_RESET}")
         return
 
     click.echo(f"Found {len(files)} file(s) to process:\n")
-    for file_path in files:
-        click.echo(f"  • {file_path}")
+    click.echo('\n'.join([f"  • {file_path}" for file_path in files]))
 
     # Confirm before proceeding (unless --apply or --dry-run)
     if not dry_run and not apply:
-        click.echo(f"\n{Fore.YELLOW}This will refactor {len(files)} file(s) using AI.{Style.RESET_ALL}")
+        click.echo(f"\n{_YELLOW}This will refactor {len(files)} file(s) using AI.{_RESET}")
         if not click.confirm("Do you want to continue?", default=True):
-            click.echo(f"{Fore.YELLOW}Operation cancelled{Style.RESET_ALL}")
+            click.echo(f"{_YELLOW}Operation cancelled{_RESET}")
             return
 
     # Ensure API key is configured before making AI calls
     if not dry_run and not ensure_api_key():
-        click.echo(f"\n{Fore.RED}Cannot proceed without API key{Style.RESET_ALL}")
+        click.echo(f"\n{_RED}Cannot proceed without API key{_RESET}")
         return
 
     # Initialize AI client if not dry run
@@ -480,13 +660,13 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
     if not dry_run:
         try:
             ai_client = AIClient()
-            click.echo(f"\n{Fore.CYAN}Model: {ai_client.model}{Style.RESET_ALL}")
+            click.echo(f"\n{_CYAN}Model: {ai_client.model}{_RESET}")
         except Exception as e:
-            click.echo(f"{Fore.RED}Error initializing AI client: {e}{Style.RESET_ALL}")
+            click.echo(f"{_RED}Error initializing AI client: {e}{_RESET}")
             return
 
     # Process files
-    click.echo(f"\n{Fore.CYAN}Processing files...{Style.RESET_ALL}")
+    click.echo(f"\n{_CYAN}Processing files...{_RESET}")
     batch_processor = BatchProcessor(
         policy_engine=policy_engine,
         scanner=scanner,
@@ -495,7 +675,8 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
         audit_logger=audit_logger,
         no_backup=no_backup,
         dry_run=dry_run,
-        apply=apply
+        apply=apply,
+        max_concurrency=concurrency
     )
 
     batch_result = batch_processor.process_files(
@@ -507,20 +688,20 @@ def bulk_refactor(paths, target, policy, no_backup, dry_run, apply, recursive, p
     # Display summary
     click.echo(batch_result.get_summary())
 
-    # Show detailed results for failed/blocked files
-    if batch_result.blocked > 0:
-        click.echo(f"{Fore.YELLOW}Blocked files:{Style.RESET_ALL}")
+    # Show detailed results for failed/blocked files, sorted in one pass
+    if batch_result.blocked > 0 or batch_result.failed > 0:
+        sections = {
+            'blocked': [f"{_YELLOW}Blocked files:{_RESET}"],
+            'failed': [f"{_RED}Failed files:{_RESET}"]
+        }
         for filepath, result in batch_result.file_results.items():
-            if result['status'] == 'blocked':
-                click.echo(f"  • {filepath}: {result['reason']}")
-        click.echo()
+            lines = sections.get(result['status'])
+            if lines is not None:
+                lines.append(f"  • {filepath}: {result['reason']}")
 
-    if batch_result.failed > 0:
-        click.echo(f"{Fore.RED}Failed files:{Style.RESET_ALL}")
-        for filepath, result in batch_result.file_results.items():
-            if result['status'] == 'failed':
-                click.echo(f"  • {filepath}: {result['reason']}")
-        click.echo()
+        for lines in sections.values():
+            if len(lines) > 1:
+                click.echo('\n'.join(lines) + '\n')
 
 
 @cli.command()
@@ -529,79 +710,89 @@ def init():
 
     Creates configuration file for global or project-specific use.
     """
-    click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}AI Governance Tool - Initialization{Style.RESET_ALL}")
-    click.echo(f"{'=' * 70}\n")
-
-    click.echo("Welcome to AI Governance Tool!")
-    click.echo("This tool helps you safely refactor code using AI with security controls.\n")
+    _ensure_dotenv_loaded()
+    click.echo("\n".join([
+        _BANNER_INIT,
+        "Welcome to AI Governance Tool!",
+        "This tool helps you safely refactor code using AI with security controls.\n",
+    ]))
 
     # Check if API key already exists
-    existing_key = os.getenv('ANTHROPIC_API_KEY')
-    if existing_key and existing_key != 'your_api_key_here':
-        click.echo(f"{Fore.GREEN}✅ API key already configured{Style.RESET_ALL}\n")
-        reconfigure = click.confirm("Would you like to reconfigure it?", default=False)
+    configured, _ = _resolve_api_key()
+    if configured:
+        click.echo(f"{_GREEN}✅ API key already configured{_RESET}\n")
+        reconfigure = _yn("Would you like to reconfigure it?", default=False)
         if not reconfigure:
-            click.echo(f"\n{Fore.CYAN}Configuration unchanged. You're ready to go!{Style.RESET_ALL}")
-            click.echo(f"\nTry: ai-governance refactor <file> --target \"<description>\"\n")
+            click.echo("\n".join([
+                f"\n{_CYAN}Configuration unchanged. You're ready to go!{_RESET}",
+                f"\nTry: ai-governance refactor <file> --target \"<description>\"\n",
+            ]))
             return
 
     # Prompt for API key
-    click.echo(f"{Fore.YELLOW}Step 1: API Key Configuration{Style.RESET_ALL}")
-    click.echo("You'll need an Anthropic API key to use AI refactoring.")
-    click.echo("Get your key from: https://console.anthropic.com/\n")
+    click.echo("\n".join([
+        f"{_YELLOW}Step 1: API Key Configuration{_RESET}",
+        "You'll need an Anthropic API key to use AI refactoring.",
+        "Get your key from: https://console.anthropic.com/\n",
+    ]))
 
-    has_key = click.confirm("Do you have your API key ready?", default=True)
+    has_key = _yn("Do you have your API key ready?", default=True)
 
     if not has_key:
-        click.echo(f"\n{Fore.CYAN}No problem! You can configure it later.{Style.RESET_ALL}")
-        click.echo("When you're ready, run this command again: ai-governance init\n")
-        click.echo("You can also configure it on your first refactor command.\n")
+        click.echo("\n".join([
+            f"\n{_CYAN}No problem! You can configure it later.{_RESET}",
+            "When you're ready, run this command again: ai-governance init\n",
+            "You can also configure it on your first refactor command.\n",
+        ]))
         return
 
     # Get API key from user
     api_key = click.prompt(
-        f"\n{Fore.CYAN}Enter your Anthropic API key{Style.RESET_ALL}",
+        f"\n{_CYAN}Enter your Anthropic API key{_RESET}",
         hide_input=True,
-        type=str
-    ).strip()
+        value_proc=str.strip
+    )
 
     # Basic validation
-    if not api_key or api_key == 'your_api_key_here':
-        click.echo(f"\n{Fore.RED}Invalid API key provided{Style.RESET_ALL}")
-        click.echo("Please run this command again when you have a valid API key.\n")
+    if api_key in _INVALID_KEYS:
+        click.echo("\n".join([
+            f"\n{_RED}Invalid API key provided{_RESET}",
+            "Please run this command again when you have a valid API key.\n",
+        ]))
         return
 
     # Verify the key works by setting it temporarily
     os.environ['ANTHROPIC_API_KEY'] = api_key
+    _get_api_key.cache_clear()
 
-    click.echo(f"\n{Fore.GREEN}✅ API key validated!{Style.RESET_ALL}\n")
+    click.echo(f"\n{_GREEN}✅ API key validated!{_RESET}\n")
 
     # Explain the security model
-    click.echo(f"{Fore.YELLOW}Security Note:{Style.RESET_ALL}")
-    click.echo("For security, API keys are NOT saved to disk by this tool.")
-    click.echo("You'll be prompted to enter your key when starting each session.\n")
-
-    click.echo(f"{Fore.CYAN}If you prefer to set it permanently, add this to your shell profile:{Style.RESET_ALL}")
-    click.echo(f"  export ANTHROPIC_API_KEY='{api_key[:10]}...'\n")
-
-    click.echo(f"{Fore.CYAN}Shell profile locations:{Style.RESET_ALL}")
-    click.echo("  Bash: ~/.bashrc or ~/.bash_profile")
-    click.echo("  Zsh:  ~/.zshrc")
-    click.echo("  Fish: ~/.config/fish/config.fish\n")
+    click.echo("\n".join([
+        f"{_YELLOW}Security Note:{_RESET}",
+        "For security, API keys are NOT saved to disk by this tool.",
+        "You'll be prompted to enter your key when starting each session.\n",
+        f"{_CYAN}If you prefer to set it permanently, add this to your shell profile:{_RESET}",
+        f"  export ANTHROPIC_API_KEY='{api_key[:10]}...'\n",
+        f"{_CYAN}Shell profile locations:{_RESET}",
+        "  Bash: ~/.bashrc or ~/.bash_profile",
+        "  Zsh:  ~/.zshrc",
+        "  Fish: ~/.config/fish/config.fish\n",
+    ]))
 
     # Show success message and next steps
-    click.echo(f"{Fore.GREEN}🎉 Setup complete! You're ready to use AI Governance Tool.{Style.RESET_ALL}\n")
-
-    click.echo(f"{Fore.CYAN}Try it out:{Style.RESET_ALL}")
-    click.echo("  ai-governance refactor <file> --target \"modernize code\"")
-    click.echo("  ai-governance refactor <file> --target \"add comments\" --dry-run")
-    click.echo("  ai-governance audit\n")
-
-    click.echo(f"{Fore.CYAN}Features:{Style.RESET_ALL}")
-    click.echo("  • Security scanning - Blocks files with sensitive data")
-    click.echo("  • Audit logging - Tracks all actions in .ai-governance-audit.db")
-    click.echo("  • Cost tracking - Shows estimated costs before API calls")
-    click.echo("  • Policy controls - Customizable with --policy <path-to-yaml>\n")
+    click.echo("\n".join([
+        f"{_GREEN}🎉 Setup complete! You're ready to use AI Governance Tool.{_RESET}\n",
+        f"{_CYAN}Try it out:{_RESET}",
+        "  ai-governance refactor <file> --target \"modernize code\"",
+        "  ai-governance refactor <file> --target \"add comments\" --dry-run",
+        "  ai-governance audit\n",
+        f"{_CYAN}Features:{_RESET}",
+        "  • Security scanning - Blocks files with sensitive data",
+        "  • Audit logging - Tracks all actions in .ai-governance-audit.db",
+        "  • Cost tracking - Shows estimated costs before API calls",
+        "  • Policy controls - Customizable with --policy <path-to-yaml>\n",
+    ]))
 
 
 @cli.command()
@@ -614,7 +805,7 @@ def init():
 @click.option(
     '--status',
     '-s',
-    type=click.Choice(['allowed', 'blocked', 'error', 'success']),
+    type=_AUDIT_STATUS,
     help='Filter by status'
 )
 @click.option(
@@ -630,8 +821,9 @@ def audit(limit, status, stats):
         ai-governance audit --status blocked
         ai-governance audit --stats
     """
-    click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}AI Governance Tool - Audit Logs{Style.RESET_ALL}")
-    click.echo(f"{'=' * 70}\n")
+    click.echo(_BANNER_AUDIT)
+
+    from .audit_logger import AuditLogger
 
     try:
         audit_logger = AuditLogger()
@@ -639,13 +831,13 @@ def audit(limit, status, stats):
         # Show statistics
         if stats:
             statistics = audit_logger.get_statistics()
-            click.echo(f"{Fore.YELLOW}{Style.BRIGHT}Audit Statistics:{Style.RESET_ALL}\n")
+            click.echo(f"{_YELLOW}{_BRIGHT}Audit Statistics:{_RESET}\n")
             click.echo(f"Total requests: {statistics['total_requests']}")
             click.echo(f"Total tokens:   {statistics['total_tokens']}")
             click.echo(f"Total cost:     ${statistics['total_cost']:.4f}")
             click.echo(f"Recent (24h):   {statistics['recent_24h']}\n")
 
-            click.echo(f"{Fore.YELLOW}Status Breakdown:{Style.RESET_ALL}")
+            click.echo(f"{_YELLOW}Status Breakdown:{_RESET}")
             for status_name, count in statistics['status_counts'].items():
                 click.echo(f"  {status_name}: {count}")
             return
@@ -653,21 +845,19 @@ def audit(limit, status, stats):
         # Get logs
         if status:
             logs = audit_logger.get_logs_by_status(status, limit)
-            click.echo(f"{Fore.YELLOW}Showing {len(logs)} logs with status: {status}{Style.RESET_ALL}")
+            click.echo(f"{_YELLOW}Showing {len(logs)} logs with status: {status}{_RESET}")
         else:
             logs = audit_logger.get_recent_logs(limit)
-            click.echo(f"{Fore.YELLOW}Showing {len(logs)} most recent logs{Style.RESET_ALL}")
+            click.echo(f"{_YELLOW}Showing {len(logs)} most recent logs{_RESET}")
 
         # Display logs
-        for log_entry in logs:
-            formatted = audit_logger.format_log_entry(log_entry)
-            click.echo(formatted)
-
-        if not logs:
-            click.echo(f"\n{Fore.YELLOW}No audit logs found{Style.RESET_ALL}")
+        if logs:
+            click.echo(audit_logger.format_logs_batch(logs))
+        else:
+            click.echo(f"\n{_YELLOW}No audit logs found{_RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error reading audit logs: {e}{Style.RESET_ALL}")
+        click.echo(f"{_RED}Error reading audit logs: {e}{_RESET}")
 
 
 @cli.command()
@@ -697,23 +887,22 @@ def dashboard(host, port, no_debug):
         ai-governance dashboard
         ai-governance dashboard --port 8080
     """
-    click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}AI Governance Tool - Dashboard{Style.RESET_ALL}")
-    click.echo(f"{'=' * 70}\n")
+    click.echo(_BANNER_DASHBOARD)
 
     try:
         from .web_ui import run_server
 
-        click.echo(f"{Fore.GREEN}Starting web dashboard...{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}Open your browser to: http://{host}:{port}{Style.RESET_ALL}\n")
+        click.echo(f"{_GREEN}Starting web dashboard...{_RESET}")
+        click.echo(f"{_YELLOW}Open your browser to: http://{host}:{port}{_RESET}\n")
 
         run_server(host=host, port=port, debug=not no_debug)
 
     except ImportError as e:
-        click.echo(f"{Fore.RED}Error: Flask is not installed{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}Install it with: pip install flask{Style.RESET_ALL}")
-        click.echo(f"{Fore.DIM}Full error: {e}{Style.RESET_ALL}")
+        click.echo(f"{_RED}Error: Flask is not installed{_RESET}")
+        click.echo(f"{_YELLOW}Install it with: pip install flask{_RESET}")
+        click.echo(f"{_DIM}Full error: {e}{_RESET}")
     except Exception as e:
-        click.echo(f"{Fore.RED}Error starting dashboard: {e}{Style.RESET_ALL}")
+        click.echo(f"{_RED}Error starting dashboard: {e}{_RESET}")
 
 
 if __name__ == '__main__':
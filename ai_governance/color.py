@@ -0,0 +1,8 @@
+"""Color helpers shared by the CLI and the diff manager."""
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style where every code is ''."""
+
+    def __getattr__(self, name):
+        return ''
@@ -1,26 +1,151 @@
 """Diff manager for displaying code changes and managing backups."""
 
 import difflib
+import io
+import os
 import shutil
+import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init(autoreset=True)
+from .color import _NoColor
+
+# Optional C implementation of difflib's matcher (pip install ai-governance-tool[speedups])
+try:
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    _SequenceMatcher = difflib.SequenceMatcher
+
+# Color is the default only for interactive output without NO_COLOR;
+# colorama is not set up at all otherwise
+_COLOR_DEFAULT = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+if _COLOR_DEFAULT:
+    init(autoreset=True)
+
+_NO_COLOR = _NoColor()
+
+_SEP = '=' * 70
+
+# Diff line colors, looked up by the line's first character; '+++' and
+# '---' file header lines are checked for first
+_FILE_HEADERS = frozenset({'+++', '---'})
+_FILE_HEADER_COLOR = Fore.CYAN + Style.BRIGHT
+_PREFIX_COLOR = {
+    '@': Fore.MAGENTA + Style.BRIGHT,
+    '+': Fore.GREEN,
+    '-': Fore.RED,
+}
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range the way difflib.unified_diff does."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff(
+    a: List[str],
+    b: List[str],
+    fromfile: str = '',
+    tofile: str = '',
+    lineterm: str = '\n',
+    groups: Optional[List] = None
+) -> Iterator[str]:
+    """Unified diff of two line lists, output-compatible with difflib.unified_diff.
+
+    Runs the same matching algorithm as difflib but through cdifflib's C
+    SequenceMatcher when it is installed, which is several times faster
+    on large files. Callers that already have the matcher's
+    get_grouped_opcodes(3) for a and b pass it as groups.
+    """
+    if groups is None:
+        if _SequenceMatcher is difflib.SequenceMatcher:
+            yield from difflib.unified_diff(a, b, fromfile=fromfile, tofile=tofile, lineterm=lineterm)
+            return
+        groups = _SequenceMatcher(None, a, b).get_grouped_opcodes(3)
+
+    started = False
+    for group in groups:
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@{lineterm}"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
+
+
+def _copy_file(src: Path, dst: Path):
+    """Copy a file with its metadata, like shutil.copy2().
+
+    Uses os.copy_file_range() where available (Linux), which copies inside
+    the kernel and can share blocks on copy-on-write filesystems such as
+    Btrfs and XFS. Falls back to shutil.copy2() when the call is missing
+    or refused.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining > 0:
+                    raise OSError("copy_file_range stopped early")
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # e.g. EXDEV, EINVAL or ENOSYS: copy in user space instead
+
+    shutil.copy2(src, dst)
+
+
+def _plain_diff(diff_lines: Iterable[str]) -> str:
+    """Join diff lines into plain unified diff text.
+
+    Header lines come from _unified_diff(lineterm='') without a line
+    ending, while content lines keep their own; each line ends up with
+    exactly one newline.
+    """
+    return ''.join([line if line.endswith('\n') else line + '\n' for line in diff_lines])
 
 
 class DiffManager:
     """Manages code diffs and backups."""
 
-    def __init__(self, create_backups: bool = True):
+    def __init__(self, create_backups: bool = True, colored: Optional[bool] = None):
         """Initialize diff manager.
 
         Args:
             create_backups: Whether to create backup files
+            colored: Default for colored output; None colors only when
+                stdout is a terminal and NO_COLOR is unset
         """
         self.create_backups = create_backups
+        self.colored = _COLOR_DEFAULT if colored is None else colored
 
     def create_backup(self, filepath: str) -> Optional[str]:
         """Create a backup of the original file.
@@ -42,15 +167,75 @@ class DiffManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = file_path.parent / f"{file_path.stem}.backup_{timestamp}{file_path.suffix}"
 
-        shutil.copy2(file_path, backup_path)
+        _copy_file(file_path, backup_path)
         return str(backup_path)
 
+    def apply_with_backup(self, filepath: str, new_content: str) -> Dict:
+        """Replace a file's contents, keeping the original as the backup.
+
+        The new content is written to a temporary file beside the original
+        and swapped in with os.replace, so the file is never left half
+        written. The backup is a hard link to the original file (a rename
+        where links are unsupported) rather than a copy, so it costs no
+        extra read or write. Backups use the same naming as create_backup().
+
+        Args:
+            filepath: Path to file
+            new_content: Content to write
+
+        Returns:
+            Dictionary with:
+            - success: bool
+            - backup_path: str or None
+            - error: str (if failed)
+        """
+        file_path = Path(filepath).resolve()
+        backup_path = None
+        tmp_path = None
+        renamed = False
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=file_path.parent,
+                prefix=f".{file_path.name}.",
+                suffix='.tmp'
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            shutil.copymode(file_path, tmp_path)
+
+            if self.create_backups:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_path = file_path.parent / f"{file_path.stem}.backup_{timestamp}{file_path.suffix}"
+                try:
+                    os.link(file_path, backup_path)
+                except OSError:
+                    os.rename(file_path, backup_path)
+                    renamed = True
+
+            os.replace(tmp_path, file_path)
+            return {
+                'success': True,
+                'backup_path': str(backup_path) if backup_path else None
+            }
+
+        except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            if renamed and not file_path.exists():
+                os.rename(backup_path, file_path)
+            return {
+                'success': False,
+                'backup_path': str(backup_path) if backup_path and backup_path.exists() else None,
+                'error': str(e)
+            }
+
     def generate_diff(
         self,
         original: str,
         refactored: str,
         filepath: str,
-        colored: bool = True
+        colored: Optional[bool] = None
     ) -> str:
         """Generate a diff between original and refactored code.
 
@@ -58,16 +243,21 @@ class DiffManager:
             original: Original code
             refactored: Refactored code
             filepath: Path to file (for context)
-            colored: Whether to use colored output
+            colored: Whether to use colored output (default: self.colored)
 
         Returns:
             Formatted diff string
         """
+        if colored is None:
+            colored = self.colored
+        if original == refactored:
+            return ''  # unchanged code has an empty diff; skip the matcher
+
         original_lines = original.splitlines(keepends=True)
         refactored_lines = refactored.splitlines(keepends=True)
 
         # Generate unified diff
-        diff = difflib.unified_diff(
+        diff = _unified_diff(
             original_lines,
             refactored_lines,
             fromfile=f"a/{filepath}",
@@ -75,59 +265,87 @@ class DiffManager:
             lineterm=''
         )
 
+        # Both paths consume the generator in a single pass
         if colored:
-            return self._colorize_diff(list(diff))
+            return self._colorize_diff(diff)
         else:
-            return ''.join(diff)
+            return _plain_diff(diff)
 
-    def _colorize_diff(self, diff_lines: list) -> str:
+    def _colorize_diff(self, diff_lines: Iterable[str]) -> str:
         """Add colors to diff output.
 
         Args:
-            diff_lines: List of diff lines
+            diff_lines: Diff lines (a list or the unified diff generator)
 
         Returns:
             Colored diff string
         """
-        colored_lines = []
-
+        # Written piecewise into one buffer: no per-line colored copies and
+        # no list of lines held alongside the result. Line endings are
+        # handled as in _plain_diff: each line ends with exactly one newline.
+        buf = io.StringIO()
+        write = buf.write
         for line in diff_lines:
-            if line.startswith('+++') or line.startswith('---'):
-                colored_lines.append(Fore.CYAN + Style.BRIGHT + line)
-            elif line.startswith('@@'):
-                colored_lines.append(Fore.MAGENTA + Style.BRIGHT + line)
-            elif line.startswith('+'):
-                colored_lines.append(Fore.GREEN + line)
-            elif line.startswith('-'):
-                colored_lines.append(Fore.RED + line)
-            else:
-                colored_lines.append(line)
-
-        return '\n'.join(colored_lines)
+            write(_FILE_HEADER_COLOR if line[:3] in _FILE_HEADERS else _PREFIX_COLOR.get(line[:1], ''))
+            write(line)
+            if not line.endswith('\n'):
+                write('\n')
+        return buf.getvalue()
 
     def display_diff(
         self,
         original: str,
         refactored: str,
         filepath: str,
-        colored: bool = True
-    ):
+        colored: Optional[bool] = None
+    ) -> dict:
         """Display diff to console.
 
         Args:
             original: Original code
             refactored: Refactored code
             filepath: Path to file
-            colored: Whether to use colored output
+            colored: Whether to use colored output (default: self.colored)
+
+        Returns:
+            Statistics dictionary shaped like get_stats(), counted from the
+            displayed diff. Unlike get_stats(), which ignores line endings,
+            a line whose ending changed counts as removed and added.
         """
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}")
+        original_lines = original.splitlines(keepends=True)
+        refactored_lines = refactored.splitlines(keepends=True)
+
+        # One matcher run serves both the displayed diff and the stats
+        if original == refactored:
+            groups = []  # unchanged code has an empty diff; skip the matcher
+        else:
+            groups = list(_SequenceMatcher(None, original_lines, refactored_lines)
+                          .get_grouped_opcodes(3))
+        diff_lines = _unified_diff(
+            original_lines,
+            refactored_lines,
+            fromfile=f"a/{filepath}",
+            tofile=f"b/{filepath}",
+            lineterm='',
+            groups=groups
+        )
+
+        if colored is None:
+            colored = self.colored
+        fore, style = (Fore, Style) if colored else (_NO_COLOR, _NO_COLOR)
+
+        print(f"\n{fore.CYAN}{style.BRIGHT}{_SEP}")
         print(f"DIFF: {filepath}")
-        print(f"{'=' * 70}{Style.RESET_ALL}\n")
+        print(f"{_SEP}{style.RESET_ALL}\n")
 
-        diff = self.generate_diff(original, refactored, filepath, colored)
-        print(diff)
+        if colored:
+            print(self._colorize_diff(diff_lines))
+        else:
+            print(_plain_diff(diff_lines))
+
+        print(f"\n{fore.CYAN}{style.BRIGHT}{_SEP}{style.RESET_ALL}\n")
 
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}{Style.RESET_ALL}\n")
+        return self._stats_from_groups(groups, len(original_lines), len(refactored_lines))
 
     def get_stats(self, original: str, refactored: str) -> dict:
         """Get statistics about the changes.
@@ -142,15 +360,14 @@ class DiffManager:
         original_lines = original.splitlines()
         refactored_lines = refactored.splitlines()
 
-        # Count changes
-        diff = list(difflib.unified_diff(
-            original_lines,
-            refactored_lines,
-            lineterm=''
-        ))
-
-        additions = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        # Count changes straight from the edit script; no diff text needed.
+        # Identical code (common when the model changes nothing) skips it.
+        additions = deletions = 0
+        if original != refactored:
+            for tag, i1, i2, j1, j2 in _SequenceMatcher(None, original_lines, refactored_lines).get_opcodes():
+                if tag != 'equal':
+                    deletions += i2 - i1
+                    additions += j2 - j1
 
         return {
             'original_lines': len(original_lines),
@@ -160,23 +377,52 @@ class DiffManager:
             'net_change': len(refactored_lines) - len(original_lines)
         }
 
+    @staticmethod
+    def _stats_from_groups(groups: List, original_count: int, refactored_count: int) -> dict:
+        """Count additions and deletions in a matcher's grouped opcodes.
+
+        Args:
+            groups: get_grouped_opcodes() result the diff was built from
+            original_count: Number of lines in the original code
+            refactored_count: Number of lines in the refactored code
+
+        Returns:
+            Dictionary with statistics
+        """
+        additions = deletions = 0
+        for group in groups:
+            for tag, i1, i2, j1, j2 in group:
+                if tag != 'equal':
+                    deletions += i2 - i1
+                    additions += j2 - j1
+
+        return {
+            'original_lines': original_count,
+            'refactored_lines': refactored_count,
+            'lines_added': additions,
+            'lines_removed': deletions,
+            'net_change': refactored_count - original_count
+        }
+
     def display_stats(self, stats: dict):
         """Display change statistics.
 
         Args:
             stats: Statistics dictionary from get_stats()
         """
-        print(f"\n{Fore.YELLOW}{Style.BRIGHT}Change Statistics:{Style.RESET_ALL}")
+        fore, style = (Fore, Style) if self.colored else (_NO_COLOR, _NO_COLOR)
+
+        print(f"\n{fore.YELLOW}{style.BRIGHT}Change Statistics:{style.RESET_ALL}")
         print(f"  Original lines:   {stats['original_lines']}")
         print(f"  Refactored lines: {stats['refactored_lines']}")
-        print(f"  {Fore.GREEN}Lines added:      +{stats['lines_added']}{Style.RESET_ALL}")
-        print(f"  {Fore.RED}Lines removed:    -{stats['lines_removed']}{Style.RESET_ALL}")
+        print(f"  {fore.GREEN}Lines added:      +{stats['lines_added']}{style.RESET_ALL}")
+        print(f"  {fore.RED}Lines removed:    -{stats['lines_removed']}{style.RESET_ALL}")
 
         net_change = stats['net_change']
         if net_change > 0:
-            print(f"  Net change:       {Fore.GREEN}+{net_change}{Style.RESET_ALL}")
+            print(f"  Net change:       {fore.GREEN}+{net_change}{style.RESET_ALL}")
         elif net_change < 0:
-            print(f"  Net change:       {Fore.RED}{net_change}{Style.RESET_ALL}")
+            print(f"  Net change:       {fore.RED}{net_change}{style.RESET_ALL}")
         else:
             print(f"  Net change:       {net_change}")
 
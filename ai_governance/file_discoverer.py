@@ -6,13 +6,20 @@ Handles finding and filtering files for bulk refactoring operations.
 
 import os
 from pathlib import Path
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Set, Tuple
 import fnmatch
 
 
 class FileDiscoverer:
     """Discovers files for bulk refactoring operations."""
 
+    # Threads used to walk top-level subdirectories in parallel
+    DISCOVERY_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+    # Fewer top-level subdirectories than this are walked inline
+    PARALLEL_MIN_SUBDIRS = 4
+
     def __init__(self, supported_extensions: Set[str] = None):
         """
         Initialize FileDiscoverer.
@@ -26,7 +33,7 @@ class FileDiscoverer:
             from .language_config import get_all_extensions
             self.supported_extensions = get_all_extensions()
         else:
-            self.supported_extensions = supported_extensions
+            self.supported_extensions = frozenset(supported_extensions)
 
     def discover_files(self, paths: List[str], recursive: bool = True,
                        pattern: str = None) -> List[Path]:
@@ -41,7 +48,15 @@ class FileDiscoverer:
         Returns:
             List of Path objects for discovered files
         """
-        discovered_files = []
+        # Paths are kept as strings (cheap to hash) until the end;
+        # duplicates are dropped as they are found, preserving order
+        seen = set()
+        unique_files = []
+
+        def add(file_path: str):
+            if file_path not in seen:
+                seen.add(file_path)
+                unique_files.append(file_path)
 
         for path_str in paths:
             path = Path(path_str).resolve()
@@ -53,25 +68,16 @@ class FileDiscoverer:
             if path.is_file():
                 # Single file
                 if self._is_supported_file(path, pattern):
-                    discovered_files.append(path)
+                    add(str(path))
             elif path.is_dir():
                 # Directory - discover files within it
-                discovered_files.extend(
-                    self._discover_in_directory(path, recursive, pattern)
-                )
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_files = []
-        for file_path in discovered_files:
-            if file_path not in seen:
-                seen.add(file_path)
-                unique_files.append(file_path)
+                for file_path in self._discover_in_directory(path, recursive, pattern):
+                    add(file_path)
 
-        return unique_files
+        return [Path(file_path) for file_path in unique_files]
 
     def _discover_in_directory(self, directory: Path, recursive: bool,
-                                pattern: str = None) -> List[Path]:
+                                pattern: str = None) -> List[str]:
         """
         Discover files within a directory.
 
@@ -81,26 +87,79 @@ class FileDiscoverer:
             pattern: Optional glob pattern to filter files
 
         Returns:
-            List of discovered file paths
+            List of discovered file paths as strings
         """
-        files = []
-
-        if recursive:
-            # Recursive search
-            for root, _, filenames in os.walk(directory):
-                root_path = Path(root)
-                for filename in filenames:
-                    file_path = root_path / filename
-                    if self._is_supported_file(file_path, pattern):
-                        files.append(file_path)
+        files, subdirs = self._list_directory(str(directory), recursive, pattern)
+
+        if len(subdirs) >= self.PARALLEL_MIN_SUBDIRS:
+            # Walk each top-level subtree on its own thread; scandir releases
+            # the GIL during directory reads. map() keeps the walk order.
+            with ThreadPoolExecutor(max_workers=min(self.DISCOVERY_WORKERS, len(subdirs))) as pool:
+                for subtree in pool.map(
+                    lambda subdir: list(self._scan_directory(subdir, pattern)),
+                    subdirs
+                ):
+                    files.extend(subtree)
         else:
-            # Non-recursive search (only immediate children)
-            for item in directory.iterdir():
-                if item.is_file() and self._is_supported_file(item, pattern):
-                    files.append(item)
+            for subdir in subdirs:
+                files.extend(self._scan_directory(subdir, pattern))
 
         return files
 
+    def _list_directory(self, directory: str, recursive: bool,
+                        pattern: str = None) -> Tuple[List[str], List[str]]:
+        """
+        List one directory's supported files and subdirectories, using os.scandir.
+
+        DirEntry caches the file type from the directory listing, so no
+        extra stat() is needed per entry. Hidden entries and __pycache__
+        directories are skipped here, so their subtrees are never read.
+        Symlinked directories are not followed, matching os.walk's default.
+
+        Args:
+            directory: Directory path to list
+            recursive: Whether subdirectories should be collected
+            pattern: Optional glob pattern to filter files
+
+        Returns:
+            Tuple of (file paths, subdirectory paths) as strings
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_file():
+                        if self._is_supported_name(name, pattern):
+                            files.append(entry.path)
+                    elif (recursive and name != '__pycache__'
+                          and entry.is_dir(follow_symlinks=False)):
+                        subdirs.append(entry.path)
+        except OSError:
+            # Unreadable directory; os.walk skipped these silently too
+            pass
+
+        return files, subdirs
+
+    def _scan_directory(self, directory: str, pattern: str = None) -> Iterator[str]:
+        """
+        Recursively yield supported file paths under a directory.
+
+        Args:
+            directory: Directory path to search
+            pattern: Optional glob pattern to filter files
+
+        Yields:
+            File paths as strings, files of a directory before its subdirectories
+        """
+        files, subdirs = self._list_directory(directory, True, pattern)
+        yield from files
+        for subdir in subdirs:
+            yield from self._scan_directory(subdir, pattern)
+
     def _is_supported_file(self, file_path: Path, pattern: str = None) -> bool:
         """
         Check if a file is supported for refactoring.
@@ -112,17 +171,35 @@ class FileDiscoverer:
         Returns:
             True if file is supported, False otherwise
         """
-        # Check extension
-        if file_path.suffix not in self.supported_extensions:
+        # Skip hidden files (hidden and __pycache__ directories are pruned
+        # during directory traversal)
+        if file_path.name.startswith('.'):
             return False
 
-        # Check pattern if provided
-        if pattern and not fnmatch.fnmatch(file_path.name, pattern):
-            return False
+        return self._is_supported_name(file_path.name, pattern)
+
+    def _is_supported_name(self, name: str, pattern: str = None) -> bool:
+        """
+        Check a file name's extension and optional glob pattern.
+
+        Entries without a leading dot in supported_extensions (such as
+        'Dockerfile' or 'Makefile') match whole file names.
 
-        # Skip hidden files and __pycache__ directories
-        if any(part.startswith('.') or part == '__pycache__'
-               for part in file_path.parts):
+        Args:
+            name: File name (no directory part)
+            pattern: Optional glob pattern to match against the name
+
+        Returns:
+            True if the name is supported, False otherwise
+        """
+        # Check extension (same rule as Path.suffix), or the whole name
+        if name not in self.supported_extensions:
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot:] not in self.supported_extensions:
+                return False
+
+        # Check pattern if provided
+        if pattern and not fnmatch.fnmatch(name, pattern):
             return False
 
         return True
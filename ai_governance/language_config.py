@@ -4,7 +4,8 @@ Language Configuration for AI Governance Tool.
 Defines supported programming languages and their file extensions.
 """
 
-from typing import Set, Dict, List
+from functools import lru_cache
+from typing import Set, Dict, FrozenSet, Iterable, Tuple
 
 
 # Common programming languages and their file extensions
@@ -50,18 +51,27 @@ LANGUAGE_EXTENSIONS: Dict[str, Set[str]] = {
     'makefile': {'Makefile', 'makefile', '.make'},
 }
 
+# Reverse lookup, built once; where languages share an extension ('.h'),
+# the first language listed above wins
+_EXT_TO_LANG: Dict[str, str] = {}
+for _language, _extensions in LANGUAGE_EXTENSIONS.items():
+    for _extension in _extensions:
+        _EXT_TO_LANG.setdefault(_extension, _language)
+del _language, _extensions, _extension
 
-def get_all_extensions() -> Set[str]:
+_ALL_EXTENSIONS: FrozenSet[str] = frozenset(_EXT_TO_LANG)
+
+
+def get_all_extensions() -> FrozenSet[str]:
     """
     Get all supported file extensions.
 
+    The table is constant, so the set is built once at import.
+
     Returns:
-        Set of all file extensions
+        Frozen set of all file extensions
     """
-    all_extensions = set()
-    for extensions in LANGUAGE_EXTENSIONS.values():
-        all_extensions.update(extensions)
-    return all_extensions
+    return _ALL_EXTENSIONS
 
 
 def get_extensions_for_language(language: str) -> Set[str]:
@@ -86,20 +96,26 @@ def get_extensions_for_language(language: str) -> Set[str]:
     return LANGUAGE_EXTENSIONS[language_lower]
 
 
-def get_extensions_for_languages(languages: List[str]) -> Set[str]:
+def get_extensions_for_languages(languages: Iterable[str]) -> FrozenSet[str]:
     """
     Get file extensions for multiple languages.
 
     Args:
-        languages: List of language names
+        languages: Language names (list, tuple or set)
 
     Returns:
-        Set of file extensions for all specified languages
+        Frozen set of file extensions for all specified languages
     """
+    return _extensions_for_languages(frozenset(languages))
+
+
+@lru_cache(maxsize=None)
+def _extensions_for_languages(languages: FrozenSet[str]) -> FrozenSet[str]:
+    """Cached body of get_extensions_for_languages(), keyed on a frozenset."""
     extensions = set()
     for language in languages:
         extensions.update(get_extensions_for_language(language))
-    return extensions
+    return frozenset(extensions)
 
 
 def get_language_for_extension(extension: str) -> str:
@@ -107,16 +123,16 @@ def get_language_for_extension(extension: str) -> str:
     Get language name for a file extension.
 
     Args:
-        extension: File extension (e.g., '.py', '.js')
+        extension: File extension (e.g., '.py', '.js'), or a file name
+            listed as-is in LANGUAGE_EXTENSIONS (e.g., 'Dockerfile')
 
     Returns:
         Language name or 'unknown' if not found
     """
+    if extension in _EXT_TO_LANG:
+        return _EXT_TO_LANG[extension]
     ext = extension if extension.startswith('.') else f'.{extension}'
-    for language, extensions in LANGUAGE_EXTENSIONS.items():
-        if ext in extensions:
-            return language
-    return 'unknown'
+    return _EXT_TO_LANG.get(ext, 'unknown')
 
 
 def parse_extensions(extensions_str: str) -> Set[str]:
@@ -140,11 +156,26 @@ def parse_extensions(extensions_str: str) -> Set[str]:
     return extensions
 
 
-def get_supported_languages() -> List[str]:
+@lru_cache(maxsize=None)
+def get_supported_languages() -> Tuple[str, ...]:
+    """
+    Get all supported language names.
+
+    Returns:
+        Sorted tuple of language names
+    """
+    return tuple(sorted(LANGUAGE_EXTENSIONS.keys()))
+
+
+@lru_cache(maxsize=1)
+def render_language_table() -> str:
     """
-    Get list of all supported language names.
+    Render the numbered language/extension table shown by --list-languages.
 
     Returns:
-        Sorted list of language names
+        Table text, one line per language (no trailing newline)
     """
-    return sorted(LANGUAGE_EXTENSIONS.keys())
+    return '\n'.join([
+        f"{i:2}. {lang:15} - {', '.join(sorted(LANGUAGE_EXTENSIONS[lang]))}"
+        for i, lang in enumerate(get_supported_languages(), 1)
+    ])
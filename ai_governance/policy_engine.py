@@ -1,25 +1,131 @@
 """Policy engine for loading and managing security policies."""
 
+import hashlib
+import marshal
+import os
 import re
-import yaml
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from fnmatch import fnmatch
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from fnmatch import translate
+from functools import cached_property, lru_cache
 try:
     from importlib.resources import files
 except ImportError:
     # Python < 3.9
     from importlib_resources import files
+try:
+    # Optional multi-pattern matcher (pip install ai-governance-tool[speedups])
+    import hyperscan
+except ImportError:
+    hyperscan = None
+try:
+    # Optional linear-time regex engine (pip install ai-governance-tool[speedups])
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _policy_cache_dir() -> Path:
+    """Directory for parsed-policy snapshots."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'ai-governance'
+
+
+@lru_cache(maxsize=1)
+def _safe_loader():
+    """PyYAML's safe loader class, imported on first use.
+
+    Importing yaml takes ~15 ms; runs that load the policy from its
+    cached snapshot never need it.
+    """
+    try:
+        # libyaml-backed loader; several times faster than the pure-Python one
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a cache file via a temporary file and rename. Failures are ignored."""
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _findall_value(match) -> Any:
+    """The value re.findall() returns for a match."""
+    groups = match.re.groups
+    if groups == 0:
+        return match.group()
+    if groups == 1:
+        return match.group(1) or ''
+    return match.groups('')
+
+
+# Pattern syntax re2 accepts but reads differently from re: re's '$' also
+# matches before a final newline, '{,n}' is a repeat in re, and '[:' can
+# start a POSIX class in re2
+_RE2_DIVERGENT_SYNTAX = re.compile(r'\$|\{,|\[:')
+
+# ASCII characters re's \s matches and re2's or Hyperscan's may not
+_RE_ONLY_SPACE_CHARS = '\x0b\x1c\x1d\x1e\x1f'
+
+
+def _compile_re2(pattern: str):
+    """Compile a sensitive pattern with re2, or return None to keep it on re.
+
+    Only patterns that re2 reads the same way as re are compiled.
+    """
+    if re2 is None or not pattern.isascii() or _RE2_DIVERGENT_SYNTAX.search(pattern):
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    try:
+        return re2.compile(pattern, options)
+    except re2.error:
+        return None  # e.g. backreferences and lookarounds
+
+
+def _plain_ascii(text: str) -> bool:
+    """Whether re2 and Hyperscan see text the way re does.
+
+    re's \\d, \\w, \\b and case folding are Unicode-aware (under
+    IGNORECASE, [a-z] also matches 'İ' and the Kelvin sign), so only ASCII
+    text qualifies, minus the characters in _RE_ONLY_SPACE_CHARS.
+    """
+    return text.isascii() and not any(c in text for c in _RE_ONLY_SPACE_CHARS)
+
+
+def _re2_applies(text: str) -> bool:
+    """Whether re2 matches text exactly as re does."""
+    return re2 is not None and _plain_ascii(text)
 
 
 class PolicyEngine:
     """Manages security policies for AI governance."""
 
-    def __init__(self, policy_path: Optional[str] = None):
+    # Content scanned with plain regexes before the Hyperscan prefilter is
+    # compiled; building it (~0.2s) only pays off past roughly this much text
+    HYPERSCAN_BUILD_BYTES = 1 << 20
+
+    def __init__(self, policy_path: Optional[str] = None, use_cache: bool = False):
         """Initialize policy engine with a policy file.
 
         Args:
             policy_path: Path to YAML policy file. Defaults to profiles/default-secure.yaml
+            use_cache: Reuse a parsed snapshot of the policy from the user
+                cache directory while the file's mtime and size are unchanged
         """
         if policy_path is None:
             # Use package resources to find the default policy file
@@ -31,33 +137,154 @@ class PolicyEngine:
                 policy_path = Path(__file__).parent / "profiles" / "default-secure.yaml"
 
         self.policy_path = Path(policy_path)
+        self.use_cache = use_cache
         self.policy = self._load_policy()
         self._compile_patterns()
 
     def _load_policy(self) -> Dict:
-        """Load policy from YAML file."""
+        """Load policy from YAML file, or from its cached snapshot."""
         if not self.policy_path.exists():
             raise FileNotFoundError(f"Policy file not found: {self.policy_path}")
 
+        cache_path = self._cache_path() if self.use_cache else None
+        if cache_path is not None:
+            try:
+                return marshal.loads(cache_path.read_bytes())
+            except (OSError, EOFError, ValueError, TypeError):
+                pass  # missing or unreadable snapshot: parse the YAML
+
+        import yaml
+
         with open(self.policy_path, 'r') as f:
-            policy = yaml.safe_load(f)
+            policy = yaml.load(f, Loader=_safe_loader())
+
+        if cache_path is not None:
+            self._write_cache(cache_path, policy)
 
         return policy
 
+    def _cache_path(self) -> Optional[Path]:
+        """Snapshot path keyed by the policy file's path, mtime and size."""
+        try:
+            resolved = self.policy_path.resolve()
+            stat = resolved.stat()
+        except OSError:
+            return None
+
+        path_hash = hashlib.sha1(str(resolved).encode('utf-8')).hexdigest()[:16]
+        name = f"policy-{path_hash}-{stat.st_mtime_ns}-{stat.st_size}.marshal"
+        return _policy_cache_dir() / name
+
+    def _write_cache(self, cache_path: Path, policy: Dict):
+        """Write a policy snapshot atomically. Failures are ignored."""
+        try:
+            data = marshal.dumps(policy)
+        except ValueError:
+            return  # policy holds non-builtin types (e.g. YAML dates)
+
+        _write_atomic(cache_path, data)
+
     def _compile_patterns(self):
         """Compile regex patterns for efficient matching."""
+        # All blocked globs as one regex; each alternative is a named group
+        # so the matching pattern can still be reported
+        self.blocked_patterns = list(self.policy.get('blocked_file_patterns', []))
+        self._blocked_re = None
+        if self.blocked_patterns:
+            self._blocked_re = re.compile('|'.join(
+                f"(?P<p{i}>{translate(os.path.normcase(pattern))})"
+                for i, pattern in enumerate(self.blocked_patterns)
+            ))
+
         self.compiled_patterns = {}
 
         for pattern_name, pattern_info in self.policy.get('sensitive_patterns', {}).items():
             try:
                 self.compiled_patterns[pattern_name] = {
                     'regex': re.compile(pattern_info['pattern'], re.IGNORECASE),
+                    'regex2': _compile_re2(pattern_info['pattern']),
                     'description': pattern_info['description'],
                     'severity': pattern_info.get('severity', 'medium')
                 }
             except re.error as e:
                 print(f"Warning: Invalid regex pattern for {pattern_name}: {e}")
 
+        # Hyperscan prefilter over all sensitive patterns, built on demand:
+        # None = not built yet, False = unavailable
+        self._pattern_names = list(self.compiled_patterns)
+        self._hs_db = None
+        self._hs_cache_checked = False
+        self._hs_scanned_bytes = 0
+        self._hs_lock = threading.Lock()
+        self._hs_local = threading.local()
+
+    def _prefilter_db(self, content_size: int):
+        """Return the Hyperscan database, building or loading it when due.
+
+        Args:
+            content_size: Length of the content about to be scanned
+
+        Returns:
+            hyperscan.Database, or None while the regexes should run alone
+        """
+        db = self._hs_db
+        if db is None:
+            with self._hs_lock:
+                if self._hs_db is None:
+                    self._hs_db = self._build_prefilter(content_size)
+                db = self._hs_db
+        return db or None
+
+    def _build_prefilter(self, content_size: int):
+        """Load or compile the Hyperscan prefilter database.
+
+        Every pattern is compiled in prefilter mode, so Hyperscan reports a
+        superset of the patterns Python's re would find; re then runs only
+        for the patterns that were reported.
+
+        Returns:
+            hyperscan.Database, False if Hyperscan cannot be used, or None
+            if not enough content has been scanned yet to justify compiling
+        """
+        if hyperscan is None or not self._pattern_names:
+            return False
+
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._cache_path()
+            if cache_path is not None:
+                cache_path = cache_path.with_suffix('.hs')
+                if not self._hs_cache_checked:
+                    self._hs_cache_checked = True
+                    try:
+                        return hyperscan.loadb(cache_path.read_bytes(), hyperscan.HS_MODE_BLOCK)
+                    except (OSError, hyperscan.error):
+                        pass  # missing or stale database: compile below
+
+        self._hs_scanned_bytes += content_size
+        if self._hs_scanned_bytes < self.HYPERSCAN_BUILD_BYTES:
+            return None
+
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+                 | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                 | hyperscan.HS_FLAG_PREFILTER)
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        try:
+            db.compile(
+                expressions=[
+                    self.compiled_patterns[name]['regex'].pattern.encode('utf-8')
+                    for name in self._pattern_names
+                ],
+                ids=list(range(len(self._pattern_names))),
+                flags=[flags] * len(self._pattern_names)
+            )
+        except hyperscan.error:
+            return False  # a pattern Hyperscan cannot handle: keep plain re
+
+        if cache_path is not None:
+            _write_atomic(cache_path, hyperscan.dumpb(db))
+        return db
+
     def is_file_blocked(self, filepath: str) -> Tuple[bool, Optional[str]]:
         """Check if a file path matches any blocked patterns.
 
@@ -67,11 +294,14 @@ class PolicyEngine:
         Returns:
             Tuple of (is_blocked, reason)
         """
-        blocked_patterns = self.policy.get('blocked_file_patterns', [])
+        if self._blocked_re is None:
+            return False, None
 
-        for pattern in blocked_patterns:
-            if fnmatch(filepath, pattern):
-                return True, f"File path matches blocked pattern: {pattern}"
+        # Same semantics as fnmatch(); alternatives are tried in policy order
+        match = self._blocked_re.match(os.path.normcase(filepath))
+        if match:
+            pattern = self.blocked_patterns[int(match.lastgroup[1:])]
+            return True, f"File path matches blocked pattern: {pattern}"
 
         return False, None
 
@@ -85,27 +315,85 @@ class PolicyEngine:
             List of findings with pattern name, description, severity, and matches
         """
         findings = []
+        candidates = self._candidate_patterns(content)
+        use_re2 = _re2_applies(content)
 
-        for pattern_name, pattern_data in self.compiled_patterns.items():
-            matches = pattern_data['regex'].findall(content)
+        for pattern_name in candidates:
+            pattern_data = self.compiled_patterns[pattern_name]
+            if use_re2:
+                matches = [_findall_value(match) for match in
+                           self._finditer(pattern_data, content, use_re2=True)]
+            else:
+                matches = pattern_data['regex'].findall(content)
 
             if matches:
-                # Redact matches for logging (show only first few chars)
-                redacted_matches = [
-                    match[:10] + "..." if len(match) > 10 else match
-                    for match in matches[:3]  # Show max 3 examples
-                ]
-
-                findings.append({
-                    'pattern': pattern_name,
-                    'description': pattern_data['description'],
-                    'severity': pattern_data['severity'],
-                    'match_count': len(matches),
-                    'examples': redacted_matches
-                })
+                findings.append(self._finding(pattern_name, len(matches), matches[:3]))
 
         return findings
 
+    @staticmethod
+    def _finditer(pattern_data: Dict, text: str, use_re2: bool = False) -> Iterator:
+        """Iterate over a sensitive pattern's matches in text.
+
+        Runs the pattern's re2 regex when use_re2 is set and it has one;
+        the matches are the same as re's.
+        """
+        pos = 0
+        regex2 = pattern_data['regex2'] if use_re2 else None
+        if regex2 is not None:
+            for match in regex2.finditer(text, pos):
+                if match.start() == match.end():
+                    # re2's binding steps past empty matches differently
+                    # from re; let re carry on from here
+                    pos = match.start()
+                    break
+                yield match
+            else:
+                return
+        yield from pattern_data['regex'].finditer(text, pos)
+
+    def _candidate_patterns(self, text: str) -> List[str]:
+        """Names of the sensitive patterns that may match text.
+
+        With the Hyperscan prefilter this is one pass over the text;
+        otherwise every pattern is a candidate. The prefilter only runs on
+        text where its matches are a superset of re's.
+        """
+        if not _plain_ascii(text):
+            return self._pattern_names
+
+        db = self._prefilter_db(len(text))
+        if db is None:
+            return self._pattern_names
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            # Scratch space is per thread; BatchProcessor scans in threads
+            scratch = self._hs_local.scratch = hyperscan.Scratch(db)
+        db.scan(text.encode('utf-8', 'replace'),
+                match_event_handler=on_match, scratch=scratch)
+        return [name for i, name in enumerate(self._pattern_names) if i in hits]
+
+    def _finding(self, pattern_name: str, match_count: int, examples: List) -> Dict:
+        """Build one finding, redacting its example matches."""
+        pattern_data = self.compiled_patterns[pattern_name]
+        return {
+            'pattern': pattern_name,
+            'description': pattern_data['description'],
+            'severity': pattern_data['severity'],
+            'match_count': match_count,
+            # Redact matches for logging (show only first few chars)
+            'examples': [
+                match[:10] + "..." if len(match) > 10 else match
+                for match in examples[:3]  # Show max 3 examples
+            ]
+        }
+
     def get_cost_limits(self) -> Dict:
         """Get cost limit settings."""
         return self.policy.get('cost_limits', {})
@@ -116,6 +404,11 @@ class PolicyEngine:
 
     def get_policy_info(self) -> Dict:
         """Get policy metadata."""
+        return self.policy_info
+
+    @cached_property
+    def policy_info(self) -> Dict:
+        """Policy metadata, built once per engine."""
         return {
             'name': self.policy.get('name', 'unknown'),
             'version': self.policy.get('version', 'unknown'),
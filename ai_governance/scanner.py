@@ -1,13 +1,19 @@
 """Scanner module for checking files against security policies."""
 
+import io
+import os
+import stat
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional
 from .policy_engine import PolicyEngine
 
 
 class Scanner:
     """Scans files for security policy violations before AI processing."""
 
+    # Leading bytes checked for NUL to detect binary files
+    BINARY_SNIFF_BYTES = 8192
+
     def __init__(self, policy_engine: PolicyEngine):
         """Initialize scanner with a policy engine.
 
@@ -16,11 +22,16 @@ class Scanner:
         """
         self.policy_engine = policy_engine
 
-    def scan_file(self, filepath: str) -> Dict:
+    def scan_file(self, filepath: str, return_content: bool = False) -> Dict:
         """Scan a file for policy violations.
 
+        The whole text is scanned at once: a sensitive pattern can match an
+        arbitrarily long run of text, so scanning in pieces could miss it.
+
         Args:
             filepath: Path to file to scan
+            return_content: Include the file's text as 'content' when the
+                file is allowed
 
         Returns:
             Dictionary with scan results including:
@@ -28,11 +39,26 @@ class Scanner:
             - reason: str
             - findings: list of detected sensitive patterns
             - file_size: int
+            - content: str (only if allowed and return_content is set)
         """
         file_path = Path(filepath)
 
+        # One stat() answers existence, type and size
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        except OSError as e:
+            return {
+                'allowed': False,
+                'reason': f"Error reading file: {str(e)}",
+                'findings': [],
+                'file_size': 0,
+                'error': True
+            }
+
         # Check if file exists
-        if not file_path.exists():
+        if st is None:
             return {
                 'allowed': False,
                 'reason': f"File not found: {filepath}",
@@ -42,7 +68,7 @@ class Scanner:
             }
 
         # Check if it's a file (not directory)
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {
                 'allowed': False,
                 'reason': f"Not a file: {filepath}",
@@ -51,44 +77,109 @@ class Scanner:
                 'error': True
             }
 
-        # Get file size
-        file_size = file_path.stat().st_size
+        file_size = st.st_size
 
         # Check file path patterns
-        is_blocked, block_reason = self.policy_engine.is_file_blocked(str(file_path))
-        if is_blocked:
-            return {
-                'allowed': False,
-                'reason': block_reason,
-                'findings': [],
-                'file_size': file_size,
-                'error': False
-            }
+        blocked_result = self._check_path(file_path, file_size)
+        if blocked_result is not None:
+            return blocked_result
 
-        # Read and scan file content
+        # Read file content
+        binary = False
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as raw:
+                # A NUL byte near the start marks a binary file (the test git
+                # and grep use); reject it before decoding anything
+                if b'\x00' in raw.peek(self.BINARY_SNIFF_BYTES)[:self.BINARY_SNIFF_BYTES]:
+                    binary = True
+                else:
+                    content = io.TextIOWrapper(raw, encoding='utf-8').read()
         except UnicodeDecodeError:
+            binary = True
+        except Exception as e:
             return {
                 'allowed': False,
-                'reason': "File is not a valid text file (binary content detected)",
+                'reason': f"Error reading file: {str(e)}",
                 'findings': [],
                 'file_size': file_size,
                 'error': True
             }
-        except Exception as e:
+
+        if binary:
+            return self._binary_result(file_size)
+
+        findings = self.policy_engine.scan_content(content)
+        result = self._findings_result(findings, file_size)
+        if return_content and result['allowed']:
+            result['content'] = content
+        return result
+
+    def scan_bytes(self, filepath: str, data: bytes, return_content: bool = False) -> Dict:
+        """Scan file content the caller has already read.
+
+        Applies the same path, binary and content checks as scan_file(),
+        without opening the file; filepath is only matched against the
+        blocked path patterns.
+
+        Args:
+            filepath: Path the content was read from
+            data: Raw file content
+            return_content: Include the decoded text as 'content' when the
+                file is allowed
+
+        Returns:
+            Dictionary with scan results, as from scan_file()
+        """
+        file_size = len(data)
+
+        blocked_result = self._check_path(Path(filepath), file_size)
+        if blocked_result is not None:
+            return blocked_result
+
+        if b'\x00' in data[:self.BINARY_SNIFF_BYTES]:
+            return self._binary_result(file_size)
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return self._binary_result(file_size)
+
+        # Universal newlines, as scan_file() reads in text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        findings = self.policy_engine.scan_content(content)
+        result = self._findings_result(findings, file_size)
+        if return_content and result['allowed']:
+            result['content'] = content
+        return result
+
+    def _check_path(self, file_path: Path, file_size: int) -> Optional[Dict]:
+        """Scan result for a path matching a blocked pattern, else None."""
+        is_blocked, block_reason = self.policy_engine.is_file_blocked(str(file_path))
+        if is_blocked:
             return {
                 'allowed': False,
-                'reason': f"Error reading file: {str(e)}",
+                'reason': block_reason,
                 'findings': [],
                 'file_size': file_size,
-                'error': True
+                'error': False
             }
+        return None
 
-        # Scan content for sensitive patterns
-        findings = self.policy_engine.scan_content(content)
+    @staticmethod
+    def _binary_result(file_size: int) -> Dict:
+        """Scan result for content that is not UTF-8 text."""
+        return {
+            'allowed': False,
+            'reason': "File is not a valid text file (binary content detected)",
+            'findings': [],
+            'file_size': file_size,
+            'error': True
+        }
 
+    @staticmethod
+    def _findings_result(findings: List[Dict], file_size: int) -> Dict:
+        """Scan result for scanned content, blocked if anything was found."""
         if findings:
             # Build detailed reason
             critical_findings = [f for f in findings if f['severity'] == 'critical']
@@ -109,8 +200,7 @@ class Scanner:
                 'reason': reason,
                 'findings': findings,
                 'file_size': file_size,
-                'error': False,
-                'content': content
+                'error': False
             }
 
         # File passed all checks
@@ -119,8 +209,7 @@ class Scanner:
             'reason': "No policy violations detected",
             'findings': [],
             'file_size': file_size,
-            'error': False,
-            'content': content
+            'error': False
         }
 
     def format_scan_result(self, scan_result: Dict, filepath: str) -> str:
@@ -1,18 +1,59 @@
 """Web UI for AI Governance Tool Audit Dashboard."""
 
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from pathlib import Path
 import json
+import threading
 from .audit_logger import AuditLogger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 app = Flask(__name__,
     template_folder='templates',
     static_folder='static')
 
 
+class _ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Keeps the default provider's sorted keys and debug indentation, and
+    hands types orjson doesn't cover (and datetimes, to keep Flask's HTTP
+    date format) to the default provider's fallback.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+
+if orjson is not None:
+    app.json = _ORJSONProvider(app)
+
+
+_audit_logger = None
+_audit_logger_lock = threading.Lock()
+
+
 def get_audit_logger():
-    """Get audit logger instance."""
-    return AuditLogger()
+    """Get the shared audit logger instance.
+
+    Created on first use and reused by every request; AuditLogger is safe
+    to share between the dev server's threads.
+    """
+    global _audit_logger
+    if _audit_logger is None:
+        with _audit_logger_lock:
+            if _audit_logger is None:
+                _audit_logger = AuditLogger()
+    return _audit_logger
 
 
 @app.route('/')
@@ -53,9 +94,7 @@ def get_log_detail(log_id):
     """Get detailed information for a specific audit log entry."""
     audit_logger = get_audit_logger()
 
-    # Get all logs and find the one with matching ID
-    logs = audit_logger.get_recent_logs(limit=10000)
-    log_entry = next((log for log in logs if log['id'] == log_id), None)
+    log_entry = audit_logger.get_log_by_id(log_id)
 
     if not log_entry:
         return jsonify({
@@ -63,6 +102,9 @@ def get_log_detail(log_id):
             'error': 'Log entry not found'
         }), 404
 
+    log_entry['findings'] = audit_logger.format_findings(log_entry['findings'])
+    log_entry.update(audit_logger.get_code(log_id) or {})
+
     return jsonify({
         'success': True,
         'log': log_entry
@@ -4,7 +4,11 @@ Demo script for AI Governance Tool
 Demonstrates security controls by scanning all demo files
 """
 
+import argparse
+import io
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from colorama import Fore, Style, init
 
@@ -16,6 +20,38 @@ from ai_governance.audit_logger import AuditLogger
 init(autoreset=True)
 
 
+# Demo files and what the scanner is expected to decide for each
+_DEMO_DIR = Path(__file__).parent / "demo" / "legacy_code"
+_DEMO_FILES = (
+    ("user_service.py", "Should be BLOCKED - contains API key and password"),
+    ("email_handler.py", "Should be BLOCKED - contains SMTP password and emails"),
+    ("payment_processor.py", "Should be BLOCKED - contains credit card data"),
+    ("utils.py", "Should be ALLOWED - clean code, no sensitive data"),
+    ("helper_functions.py", "Should be ALLOWED - clean code, no sensitive data"),
+)
+
+# Scanner used by scan worker processes, built once per process
+_worker_scanner = None
+
+
+def _init_scan_worker():
+    """Build the scanner for a scan worker process"""
+    global _worker_scanner
+    _worker_scanner = Scanner(PolicyEngine())
+
+
+def _read_and_scan(scanner, path):
+    """Read a file in one buffered read and scan the bytes"""
+    with open(path, 'rb', buffering=65536) as f:
+        data = f.read()
+    return scanner.scan_bytes(path, data)
+
+
+def _scan_one(path):
+    """Scan one file in a worker process; returns (path, scan_result)"""
+    return path, _read_and_scan(_worker_scanner, path)
+
+
 def print_header(text):
     """Print a formatted header"""
     print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}")
@@ -29,8 +65,13 @@ def print_section(text):
     print(f"{'-' * 70}")
 
 
-def demo_security_scanning():
-    """Demonstrate security scanning on all demo files"""
+def demo_security_scanning(workers=None):
+    """Demonstrate security scanning on all demo files
+
+    Args:
+        workers: Processes used to scan the files (default: CPU count);
+            0 or 1 scans in this process
+    """
     print_header("AI Governance Tool - Security Scanning Demo")
 
     # Initialize components
@@ -48,64 +89,77 @@ def demo_security_scanning():
     print(f"  Blocked patterns: {policy_info['blocked_patterns_count']}")
     print(f"  Sensitive patterns: {policy_info['sensitive_patterns_count']}")
 
-    # Demo files
-    demo_dir = Path(__file__).parent / "demo" / "legacy_code"
-    demo_files = [
-        ("user_service.py", "Should be BLOCKED - contains API key and password"),
-        ("email_handler.py", "Should be BLOCKED - contains SMTP password and emails"),
-        ("payment_processor.py", "Should be BLOCKED - contains credit card data"),
-        ("utils.py", "Should be ALLOWED - clean code, no sensitive data"),
-        ("helper_functions.py", "Should be ALLOWED - clean code, no sensitive data"),
-    ]
-
     results = []
+    log_entries = []
+
+    # One directory listing answers which demo files exist, instead of a
+    # stat() per file
+    with os.scandir(_DEMO_DIR) as it:
+        present = {entry.name: entry for entry in it if entry.is_file()}
+
+    # Scan every file up front (regex matching is CPU-bound, so files are
+    # spread over processes), then report and log from this process
+    paths = [present[filename].path for filename, _ in _DEMO_FILES
+             if filename in present]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)),
+                                 initializer=_init_scan_worker) as executor:
+            scan_results = dict(executor.map(_scan_one, paths))
+    else:
+        scan_results = {path: _read_and_scan(scanner, path) for path in paths}
 
     print_section("Scanning Demo Files")
 
-    for filename, description in demo_files:
-        filepath = demo_dir / filename
-        print(f"\n{Fore.CYAN}File: {filename}{Style.RESET_ALL}")
-        print(f"Expected: {description}")
+    for filename, description in _DEMO_FILES:
+        # Collect the file's report and write it to stdout in one call
+        out = io.StringIO()
+        entry = present.get(filename)
+        print(f"\n{Fore.CYAN}File: {filename}{Style.RESET_ALL}", file=out)
+        print(f"Expected: {description}", file=out)
 
-        if not filepath.exists():
-            print(f"{Fore.RED}ERROR: File not found{Style.RESET_ALL}")
+        if entry is None:
+            print(f"{Fore.RED}ERROR: File not found{Style.RESET_ALL}", file=out)
+            sys.stdout.write(out.getvalue())
             continue
 
-        # Scan file
-        scan_result = scanner.scan_file(str(filepath))
+        scan_result = scan_results[entry.path]
 
         # Display result
         if scan_result.get('error'):
-            print(f"{Fore.RED}❌ ERROR: {scan_result['reason']}{Style.RESET_ALL}")
+            print(f"{Fore.RED}❌ ERROR: {scan_result['reason']}{Style.RESET_ALL}", file=out)
             status = 'error'
         elif scan_result['allowed']:
-            print(f"{Fore.GREEN}✅ ALLOWED: {scan_result['reason']}{Style.RESET_ALL}")
-            print(f"File size: {scan_result['file_size']} bytes")
+            print(f"{Fore.GREEN}✅ ALLOWED: {scan_result['reason']}{Style.RESET_ALL}", file=out)
+            print(f"File size: {scan_result['file_size']} bytes", file=out)
             status = 'allowed'
         else:
-            print(f"{Fore.RED}🚫 BLOCKED: {scan_result['reason']}{Style.RESET_ALL}")
-            print(f"File size: {scan_result['file_size']} bytes")
+            print(f"{Fore.RED}🚫 BLOCKED: {scan_result['reason']}{Style.RESET_ALL}", file=out)
+            print(f"File size: {scan_result['file_size']} bytes", file=out)
 
             if scan_result['findings']:
-                print(f"\n{Fore.YELLOW}Security Findings:{Style.RESET_ALL}")
+                print(f"\n{Fore.YELLOW}Security Findings:{Style.RESET_ALL}", file=out)
                 for finding in scan_result['findings']:
                     severity_color = Fore.RED if finding['severity'] == 'critical' else Fore.YELLOW
                     print(f"  • {severity_color}{finding['pattern']}{Style.RESET_ALL} "
-                          f"({finding['severity']}): {finding['description']}")
-                    print(f"    Matches: {finding['match_count']}")
+                          f"({finding['severity']}): {finding['description']}", file=out)
+                    print(f"    Matches: {finding['match_count']}", file=out)
                     if finding['examples']:
-                        print(f"    Examples: {', '.join(finding['examples'])}")
+                        print(f"    Examples: {', '.join(finding['examples'])}", file=out)
 
             status = 'blocked'
 
-        # Log to audit
-        audit_logger.log_action(
-            filepath=str(filepath),
-            action='demo_scan',
-            status=status,
-            reason=scan_result.get('reason'),
-            findings=scan_result.get('findings', [])
-        )
+        sys.stdout.write(out.getvalue())
+
+        # Log to audit (written together after the loop)
+        log_entries.append({
+            'filepath': entry.path,
+            'action': 'demo_scan',
+            'status': status,
+            'reason': scan_result.get('reason'),
+            'findings': scan_result.get('findings', [])
+        })
 
         results.append({
             'filename': filename,
@@ -113,6 +167,9 @@ def demo_security_scanning():
             'error': scan_result.get('error', False)
         })
 
+    # Write all of the demo's audit records in one transaction
+    audit_logger.log_actions_bulk(log_entries)
+
     # Summary
     print_section("Summary")
 
@@ -167,8 +224,13 @@ def demo_security_scanning():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI Governance Tool security scanning demo")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes used to scan the demo files (default: CPU count)")
+    args = parser.parse_args()
+
     try:
-        demo_security_scanning()
+        demo_security_scanning(workers=args.workers)
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}Demo interrupted by user{Style.RESET_ALL}")
     except Exception as e:
@@ -3,20 +3,17 @@ Legacy Helper Functions - Clean code for string and list operations
 This file should PASS the security scanner and be allowed for refactoring
 """
 
+from collections import defaultdict
+
 
 def capitalize_words(text):
     """Capitalize first letter of each word - old implementation"""
     if not text:
         return ""
 
-    words = text.split()
-    capitalized = []
-
-    for word in words:
-        if len(word) > 0:
-            capitalized.append(word[0].upper() + word[1:].lower())
-
-    return ' '.join(capitalized)
+    # Not str.capitalize(): that titlecases the first character ('ǅ', 'ﬁ'),
+    # while the original upper-cased it
+    return ' '.join([word[:1].upper() + word[1:].lower() for word in text.split()])
 
 
 def reverse_string(text):
@@ -41,6 +38,12 @@ def remove_duplicates(items):
     if not items:
         return []
 
+    # Hash-based and order-preserving; O(n) instead of O(n^2)
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        pass  # unhashable items: fall back to comparing against a list
+
     seen = []
     result = []
 
@@ -57,6 +60,12 @@ def find_common_elements(list1, list2):
     if not list1 or not list2:
         return []
 
+    try:
+        lookup = set(list2)
+        return list(dict.fromkeys(item for item in list1 if item in lookup))
+    except TypeError:
+        pass  # unhashable items: fall back to list scans
+
     common = []
     for item in list1:
         if item in list2 and item not in common:
@@ -66,16 +75,21 @@ def find_common_elements(list1, list2):
 
 
 def flatten_list(nested_list):
-    """Flatten a nested list - recursive old method"""
+    """Flatten a nested list - iterative, with a stack of iterators"""
     if not nested_list:
         return []
 
     result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten_list(item))
-        else:
+    stack = [iter(nested_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                # Descend; this level resumes where it left off afterwards
+                stack.append(iter(item))
+                break
             result.append(item)
+        else:
+            stack.pop()
 
     return result
 
@@ -85,14 +99,11 @@ def group_by_length(strings):
     if not strings:
         return {}
 
-    groups = {}
+    groups = defaultdict(list)
     for string in strings:
-        length = len(string)
-        if length not in groups:
-            groups[length] = []
-        groups[length].append(string)
+        groups[len(string)].append(string)
 
-    return groups
+    return dict(groups)
 
 
 def calculate_average(numbers):
@@ -100,17 +111,14 @@ def calculate_average(numbers):
     if not numbers:
         return 0
 
-    total = 0
-    count = 0
-
-    for num in numbers:
-        total += num
-        count += 1
+    # sum() and len() run their loops in C; iterables without a length
+    # (generators, for example) are collected into a list first
+    if not hasattr(numbers, '__len__'):
+        numbers = list(numbers)
+        if not numbers:
+            return 0
 
-    if count == 0:
-        return 0
-
-    return total / float(count)
+    return sum(numbers) / float(len(numbers))
 
 
 def find_max_min(numbers):
@@ -118,16 +126,7 @@ def find_max_min(numbers):
     if not numbers:
         return None, None
 
-    max_val = numbers[0]
-    min_val = numbers[0]
-
-    for num in numbers[1:]:
-        if num > max_val:
-            max_val = num
-        if num < min_val:
-            min_val = num
-
-    return max_val, min_val
+    return max(numbers), min(numbers)
 
 
 def is_palindrome(text):
@@ -138,25 +137,20 @@ def is_palindrome(text):
     # Remove spaces and convert to lowercase
     cleaned = text.replace(' ', '').lower()
 
+    # Most non-palindromes already differ at the ends; skip the reversed copy
+    if cleaned[:1] != cleaned[-1:]:
+        return False
+
     # Compare with reverse
     return cleaned == cleaned[::-1]
 
 
 def swap_case(text):
-    """Swap case of characters - old manual method"""
+    """Swap case of characters - uses str.swapcase()"""
     if not text:
         return ""
 
-    result = []
-    for char in text:
-        if char.isupper():
-            result.append(char.lower())
-        elif char.islower():
-            result.append(char.upper())
-        else:
-            result.append(char)
-
-    return ''.join(result)
+    return text.swapcase()
 
 
 def rotate_list(lst, positions):
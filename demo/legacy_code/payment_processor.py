@@ -3,6 +3,10 @@ Legacy Payment Processor - Old credit card handling code
 This file contains test credit card data and should be BLOCKED by the scanner
 """
 
+# Luhn: each digit's value once doubled (digits of the product summed),
+# as a bytes.translate() table over the ASCII digits
+_LUHN_DOUBLED = bytes.maketrans(b'0123456789', bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+
 
 class PaymentProcessor:
     def __init__(self):
@@ -16,21 +20,16 @@ class PaymentProcessor:
         # Remove hyphens and spaces
         card_number = card_number.replace('-', '').replace(' ', '')
 
-        # Check length
-        if len(card_number) != 16:
+        # Check length and characters
+        if len(card_number) != 16 or not (card_number.isascii() and card_number.isdigit()):
             return False
 
-        # Luhn algorithm
-        total = 0
-        reverse_digits = card_number[::-1]
-
-        for i, digit in enumerate(reverse_digits):
-            n = int(digit)
-            if i % 2 == 1:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            total += n
+        # Luhn algorithm, without a per-digit loop: counting from the right,
+        # odd positions add their digit, even positions their doubled value
+        digits = card_number.encode('ascii')
+        kept = digits[-1::-2]
+        doubled = digits[-2::-2].translate(_LUHN_DOUBLED)
+        total = sum(kept) - ord('0') * len(kept) + sum(doubled)
 
         return total % 10 == 0
 
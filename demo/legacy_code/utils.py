@@ -6,6 +6,14 @@ This file should PASS the security scanner and be allowed for refactoring
 import re
 from datetime import datetime
 
+# Patterns compiled once at import instead of on every call
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]{3,20}$')  # 3-20 chars, alphanumeric and underscore
+_SLUG_STRIP = re.compile(r'[^a-z0-9-]')
+_SLUG_DASH = re.compile(r'-+')
+
+# HTML-escapes applied by sanitize_input, as one translation table
+_SANITIZE_TABLE = str.maketrans({'<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
 
 def format_date(date_obj, format_string='%Y-%m-%d'):
     """Format a date object to string - old implementation"""
@@ -27,9 +35,7 @@ def validate_username(username):
     if not username:
         return False
 
-    # Old pattern: 3-20 chars, alphanumeric and underscore
-    pattern = r'^[a-zA-Z0-9_]{3,20}$'
-    return re.match(pattern, username) is not None
+    return _USERNAME_RE.match(username) is not None
 
 
 def sanitize_input(user_input):
@@ -37,13 +43,8 @@ def sanitize_input(user_input):
     if not user_input:
         return ""
 
-    # Remove potentially dangerous characters
-    sanitized = user_input.strip()
-    sanitized = sanitized.replace('<', '&lt;')
-    sanitized = sanitized.replace('>', '&gt;')
-    sanitized = sanitized.replace('"', '&quot;')
-
-    return sanitized
+    # Escape potentially dangerous characters in a single pass
+    return user_input.strip().translate(_SANITIZE_TABLE)
 
 
 def calculate_age(birth_date):
@@ -87,10 +88,10 @@ def generate_slug(title):
     slug = slug.replace(' ', '-')
 
     # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
+    slug = _SLUG_STRIP.sub('', slug)
 
     # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_DASH.sub('-', slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -103,18 +104,12 @@ def chunk_list(lst, chunk_size):
     if not lst or chunk_size <= 0:
         return []
 
-    chunks = []
-    for i in range(0, len(lst), chunk_size):
-        chunks.append(lst[i:i + chunk_size])
-
-    return chunks
+    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
 def merge_dictionaries(dict1, dict2):
-    """Merge two dictionaries - Python 2.x compatible way"""
-    result = dict1.copy()
-    result.update(dict2)
-    return result
+    """Merge two dictionaries; keys in dict2 win"""
+    return {**dict1, **dict2}
 
 
 # Example usage
@@ -27,13 +27,22 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "anthropic>=0.18.0",
+        "anthropic>=0.42.0",
         "click>=8.1.0",
         "pyyaml>=6.0",
         "colorama>=0.4.6",
         "python-dotenv>=1.0.0",
         "flask>=3.0.0",
     ],
+    extras_require={
+        "speedups": [
+            "orjson>=3.6",
+            "zstandard>=0.18",
+            "cdifflib>=1.2",
+            "hyperscan>=0.4; platform_system != 'Windows'",
+            "google-re2>=1.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "ai-governance=ai_governance.cli:cli",